@@ -7,10 +7,20 @@ before implementation exists.
 """
 import pytest
 from pathlib import Path
-from typing import Dict, Any, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping
 from datetime import date
 from decimal import Decimal
 
+if TYPE_CHECKING:
+    from x12.codes import CodeRegistry
+    from x12.core.delimiters import Delimiters
+    from x12.core.generator import Generator
+    from x12.core.parser import Parser, SegmentParser
+    from x12.core.tokenizer import Tokenizer
+    from x12.core.validator import X12Validator
+    from x12.schema import SchemaLoader
+
 
 # =============================================================================
 # Path Fixtures
@@ -48,35 +58,39 @@ def invalid_edi_dir(fixtures_dir: Path) -> Path:
 # Delimiter Fixtures
 # =============================================================================
 
+STANDARD_DELIMITERS = MappingProxyType(
+    {"element": "*", "segment": "~", "component": ":", "repetition": "^"}
+)
+PIPE_DELIMITERS = MappingProxyType(
+    {"element": "|", "segment": "~", "component": ">", "repetition": "^"}
+)
+NEWLINE_DELIMITERS = MappingProxyType(
+    {"element": "*", "segment": "\n", "component": ":", "repetition": "^"}
+)
+TAB_DELIMITERS = MappingProxyType(
+    {"element": "\t", "segment": "~", "component": ":", "repetition": "!"}
+)
+
+
 @pytest.fixture
-def standard_delimiters() -> Dict[str, str]:
-    """Standard X12 delimiters as dict (for pre-implementation tests)."""
-    return {
-        "element": "*",
-        "segment": "~",
-        "component": ":",
-        "repetition": "^",
-    }
+def standard_delimiters() -> Mapping[str, str]:
+    """Standard X12 delimiters as a read-only mapping (for pre-implementation tests)."""
+    return STANDARD_DELIMITERS
 
 
 @pytest.fixture
-def pipe_delimiters() -> Dict[str, str]:
+def pipe_delimiters() -> Mapping[str, str]:
     """Alternative pipe-based delimiters."""
-    return {
-        "element": "|",
-        "segment": "~",
-        "component": ">",
-        "repetition": "^",
-    }
+    return PIPE_DELIMITERS
 
 
 @pytest.fixture(params=[
-    {"element": "*", "segment": "~", "component": ":", "repetition": "^"},
-    {"element": "|", "segment": "~", "component": ">", "repetition": "^"},
-    {"element": "*", "segment": "\n", "component": ":", "repetition": "^"},
-    {"element": "\t", "segment": "~", "component": ":", "repetition": "!"},
+    STANDARD_DELIMITERS,
+    PIPE_DELIMITERS,
+    NEWLINE_DELIMITERS,
+    TAB_DELIMITERS,
 ])
-def various_delimiters(request) -> Dict[str, str]:
+def various_delimiters(request) -> Mapping[str, str]:
     """Parametrized fixture for testing multiple delimiter combinations."""
     return request.param
 
@@ -116,124 +130,56 @@ def isa_with_newline_terminator() -> str:
 # Sample EDI Content Fixtures
 # =============================================================================
 
-@pytest.fixture
+_VALID_EDI_DIR = Path(__file__).parent / "fixtures" / "edi" / "valid"
+
+
+def _read_valid_edi(name: str) -> str:
+    """Read a sample interchange from tests/fixtures/edi/valid."""
+    return (_VALID_EDI_DIR / name).read_text(encoding="utf-8")
+
+
+# Read once at import; the fixtures below hand out the same immutable strings
+MINIMAL_837P_CONTENT = _read_valid_edi("minimal_837p.edi")
+MINIMAL_850_CONTENT = _read_valid_edi("minimal_850.edi")
+MINIMAL_835_CONTENT = _read_valid_edi("minimal_835.edi")
+MINIMAL_270_CONTENT = _read_valid_edi("minimal_270.edi")
+MINIMAL_856_CONTENT = _read_valid_edi("minimal_856.edi")
+
+
+@pytest.fixture(scope="session")
 def minimal_837p_content() -> str:
     """Minimal valid 837P professional claim transaction."""
-    return """ISA*00*          *00*          *ZZ*SENDER         *ZZ*RECEIVER       *231127*1200*^*00501*000000001*0*P*:~
-GS*HC*SENDER*RECEIVER*20231127*1200*1*X*005010X222A1~
-ST*837*0001*005010X222A1~
-BHT*0019*00*244579*20231127*1200*CH~
-NM1*41*2*SUBMITTER NAME*****46*123456789~
-PER*IC*CONTACT NAME*TE*5551234567~
-NM1*40*2*RECEIVER NAME*****46*987654321~
-HL*1**20*1~
-NM1*85*2*BILLING PROVIDER*****XX*1234567890~
-N3*123 MAIN ST~
-N4*ANYTOWN*NY*12345~
-REF*EI*123456789~
-HL*2*1*22*0~
-SBR*P*18*******CI~
-NM1*IL*1*DOE*JOHN****MI*ABC123456~
-N3*456 OAK AVE~
-N4*SOMEWHERE*CA*90210~
-DMG*D8*19800115*M~
-NM1*PR*2*INSURANCE CO*****PI*12345~
-CLM*CLAIM001*150***11:B:1*Y*A*Y*Y~
-HI*ABK:M545~
-LX*1~
-SV1*HC:99213*150*UN*1***1~
-DTP*472*D8*20231115~
-SE*24*0001~
-GE*1*1~
-IEA*1*000000001~"""
+    return MINIMAL_837P_CONTENT
+
+
+@pytest.fixture(scope="session")
+def minimal_837p_no_bht() -> str:
+    """Minimal 837P with the BHT segment removed (computed once per session)."""
+    return MINIMAL_837P_CONTENT.replace("BHT*0019*00*244579*20231127*1200*CH~\n", "")
 
 
 @pytest.fixture
 def minimal_850_content() -> str:
     """Minimal valid 850 purchase order transaction."""
-    return """ISA*00*          *00*          *ZZ*BUYER          *ZZ*SELLER         *231127*1200*^*00401*000000001*0*P*:~
-GS*PO*BUYER*SELLER*20231127*1200*1*X*004010~
-ST*850*0001~
-BEG*00*SA*PO123456**20231127~
-N1*ST*SHIP TO LOCATION*92*SHIPTO001~
-N3*789 WAREHOUSE DR~
-N4*DISTRIBUTION*TX*75001~
-PO1*1*10*EA*25.00**UP*012345678901~
-PID*F****WIDGET BLUE~
-PO1*2*5*EA*50.00**UP*012345678902~
-PID*F****GADGET RED~
-CTT*2~
-SE*12*0001~
-GE*1*1~
-IEA*1*000000001~"""
+    return MINIMAL_850_CONTENT
 
 
 @pytest.fixture
 def minimal_835_content() -> str:
     """Minimal valid 835 remittance advice transaction."""
-    return """ISA*00*          *00*          *ZZ*PAYER          *ZZ*PAYEE          *231127*1200*^*00501*000000001*0*P*:~
-GS*HP*PAYER*PAYEE*20231127*1200*1*X*005010X221A1~
-ST*835*0001~
-BPR*I*150.00*C*ACH*CTX*01*123456789*DA*123456789*9876543210**01*111111111*DA*222222222*20231201~
-TRN*1*12345*1512345678~
-N1*PR*INSURANCE COMPANY~
-N1*PE*PROVIDER NAME*XX*1234567890~
-LX*1~
-CLP*CLAIM001*1*150*150*0*12*CLAIMREF*11*1~
-NM1*QC*1*DOE*JOHN~
-SVC*HC:99213*150*150*UN*1~
-DTM*472*20231115~
-SE*13*0001~
-GE*1*1~
-IEA*1*000000001~"""
+    return MINIMAL_835_CONTENT
 
 
 @pytest.fixture
 def minimal_270_content() -> str:
     """Minimal valid 270 eligibility inquiry transaction."""
-    return """ISA*00*          *00*          *ZZ*SENDER         *ZZ*RECEIVER       *231127*1200*^*00501*000000001*0*P*:~
-GS*HS*SENDER*RECEIVER*20231127*1200*1*X*005010X279A1~
-ST*270*0001*005010X279A1~
-BHT*0022*13*10001234*20231127*1200~
-HL*1**20*1~
-NM1*PR*2*PAYER NAME*****PI*12345~
-HL*2*1*21*1~
-NM1*1P*2*PROVIDER NAME*****XX*1234567890~
-HL*3*2*22*0~
-NM1*IL*1*DOE*JOHN****MI*ABC123456~
-DMG*D8*19800115~
-EQ*30~
-SE*12*0001~
-GE*1*1~
-IEA*1*000000001~"""
+    return MINIMAL_270_CONTENT
 
 
 @pytest.fixture
 def minimal_856_content() -> str:
     """Minimal valid 856 advance ship notice transaction."""
-    return """ISA*00*          *00*          *ZZ*SELLER         *ZZ*BUYER          *231127*1200*^*00401*000000001*0*P*:~
-GS*SH*SELLER*BUYER*20231127*1200*1*X*004010~
-ST*856*0001~
-BSN*00*SHIPMENT001*20231127*1200*0001~
-HL*1**S~
-TD1*CTN*10****G*150*LB~
-TD5**2*UPSN*M~
-REF*BM*BOL123456~
-DTM*011*20231127~
-N1*SF*SHIP FROM NAME*92*SHIPFROM001~
-N3*123 ORIGIN ST~
-N4*ORIGINCITY*CA*90001~
-N1*ST*SHIP TO NAME*92*SHIPTO001~
-N3*456 DEST AVE~
-N4*DESTCITY*TX*75001~
-HL*2*1*O~
-PRF*PO123456~
-HL*3*2*I~
-LIN**UP*012345678901~
-SN1**10*EA~
-SE*20*0001~
-GE*1*1~
-IEA*1*000000001~"""
+    return MINIMAL_856_CONTENT
 
 
 # =============================================================================
@@ -438,6 +384,89 @@ def valid_procedure_codes() -> List[str]:
     ]
 
 
+@pytest.fixture(scope="session")
+def parser() -> "Parser":
+    """Shared Parser instance.
+
+    Parser only keeps its default configuration between calls, so a single
+    instance is reused across the session.
+    """
+    from x12.core.parser import Parser
+
+    return Parser()
+
+
+@pytest.fixture(scope="session")
+def x12_validator() -> "X12Validator":
+    """Shared X12Validator instance.
+
+    The validator holds no per-call state, so one instance serves the
+    whole session instead of being rebuilt in every test.
+    """
+    from x12.core.validator import X12Validator
+
+    return X12Validator()
+
+
+@pytest.fixture(scope="session")
+def default_delimiters() -> "Delimiters":
+    """Standard X12 delimiters (* ~ : ^); Delimiters is immutable."""
+    from x12.core.delimiters import Delimiters
+
+    return Delimiters()
+
+
+@pytest.fixture(scope="session")
+def generator(default_delimiters: "Delimiters") -> "Generator":
+    """Shared Generator with standard delimiters.
+
+    Only the envelope builders advance control numbers; tests that check
+    them build their own Generator.
+    """
+    from x12.core.generator import Generator
+
+    return Generator(delimiters=default_delimiters)
+
+
+@pytest.fixture(scope="session")
+def segment_parser() -> "SegmentParser":
+    """Shared SegmentParser that auto-detects delimiters per call."""
+    from x12.core.parser import SegmentParser
+
+    return SegmentParser()
+
+
+@pytest.fixture(scope="session")
+def tokenizer() -> "Tokenizer":
+    """Shared Tokenizer that auto-detects delimiters per call."""
+    from x12.core.tokenizer import Tokenizer
+
+    return Tokenizer()
+
+
+@pytest.fixture(scope="session")
+def code_registry() -> "CodeRegistry":
+    """Shared CodeRegistry with the built-in code sets.
+
+    Tests that register custom code sets build their own registry.
+    """
+    from x12.codes import get_registry
+
+    return get_registry()
+
+
+@pytest.fixture(scope="session")
+def schema_loader() -> "SchemaLoader":
+    """Shared SchemaLoader.
+
+    The loader keeps each schema it builds, so every guide is built once
+    per session rather than once per test.
+    """
+    from x12.schema import get_schema_loader
+
+    return get_schema_loader()
+
+
 # =============================================================================
 # Error Case Fixtures
 # =============================================================================
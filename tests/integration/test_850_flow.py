@@ -14,11 +14,8 @@ from decimal import Decimal
 class TestParse850:
     """Tests for parsing 850 purchase orders."""
 
-    def test_parse_minimal_850(self, minimal_850_content):
+    def test_parse_minimal_850(self, minimal_850_content, parser):
         """Must parse minimal 850 transaction."""
-        from x12.core.parser import Parser
-        
-        parser = Parser()
         interchange = parser.parse(minimal_850_content)
         
         assert interchange is not None
@@ -28,14 +25,11 @@ class TestParse850:
         assert fg.functional_id_code == "PO"
         assert len(fg.transactions) == 1
 
-    def test_parse_extracts_beg(self, minimal_850_content):
+    def test_parse_extracts_beg(self, minimal_850_content, parser):
         """Must extract BEG segment (beginning segment for PO)."""
-        from x12.core.parser import Parser
-        
-        parser = Parser()
         interchange = parser.parse(minimal_850_content)
         
-        txn = interchange.functional_groups[0].transactions[0]
+        txn = interchange.first_transaction
         beg = txn.root_loop.get_segment("BEG")
         
         assert beg is not None
@@ -43,50 +37,28 @@ class TestParse850:
         assert beg[2].value == "SA"  # PO type - Stand-alone
         assert beg[3].value == "PO123456"  # PO number
 
-    def test_parse_extracts_n1_ship_to(self, minimal_850_content):
+    def test_parse_extracts_n1_ship_to(self, minimal_850_content, parser):
         """Must extract N1 ship-to party."""
-        from x12.core.parser import Parser
-        
-        parser = Parser()
         interchange = parser.parse(minimal_850_content)
         
-        txn = interchange.functional_groups[0].transactions[0]
+        txn = interchange.first_transaction
         
         # Find N1*ST (ship to)
-        def find_n1(loop, entity_code):
-            for seg in loop.segments:
-                if seg.segment_id == "N1" and seg[1].value == entity_code:
-                    return seg
-            for child in loop.loops:
-                result = find_n1(child, entity_code)
-                if result:
-                    return result
-            return None
-        
-        n1_st = find_n1(txn.root_loop, "ST")
+        n1_st = next(
+            (seg for seg in txn.root_loop.find_segments("N1") if seg[1].value == "ST"),
+            None,
+        )
         assert n1_st is not None
         assert "SHIP TO" in n1_st[2].value.upper()
 
-    def test_parse_extracts_line_items(self, minimal_850_content):
+    def test_parse_extracts_line_items(self, minimal_850_content, parser):
         """Must extract PO1 line items."""
-        from x12.core.parser import Parser
-        
-        parser = Parser()
         interchange = parser.parse(minimal_850_content)
         
-        txn = interchange.functional_groups[0].transactions[0]
+        txn = interchange.first_transaction
         
         # Find all PO1 segments
-        def find_all_segments(loop, seg_id):
-            results = []
-            for seg in loop.segments:
-                if seg.segment_id == seg_id:
-                    results.append(seg)
-            for child in loop.loops:
-                results.extend(find_all_segments(child, seg_id))
-            return results
-        
-        po1_segments = find_all_segments(txn.root_loop, "PO1")
+        po1_segments = txn.root_loop.find_segments("PO1")
         
         assert len(po1_segments) == 2  # Two line items
         
@@ -96,14 +68,11 @@ class TestParse850:
         assert po1_segments[0][3].value == "EA"  # Unit
         assert po1_segments[0][4].as_decimal() == Decimal("25.00")  # Price
 
-    def test_parse_extracts_ctt(self, minimal_850_content):
+    def test_parse_extracts_ctt(self, minimal_850_content, parser):
         """Must extract CTT summary segment."""
-        from x12.core.parser import Parser
-        
-        parser = Parser()
         interchange = parser.parse(minimal_850_content)
         
-        txn = interchange.functional_groups[0].transactions[0]
+        txn = interchange.first_transaction
         ctt = txn.root_loop.get_segment("CTT")
         
         assert ctt is not None
@@ -114,29 +83,19 @@ class TestParse850:
 class TestValidate850:
     """Tests for validating 850 purchase orders."""
 
-    def test_valid_850_passes(self, minimal_850_content):
+    def test_valid_850_passes(self, minimal_850_content, parser, x12_validator):
         """Valid 850 must pass validation."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
-        
-        parser = Parser()
-        validator = X12Validator()
-        
         interchange = parser.parse(minimal_850_content)
-        txn = interchange.functional_groups[0].transactions[0]
+        txn = interchange.first_transaction
         
-        report = validator.validate_transaction(txn, "004010")
+        report = x12_validator.validate_transaction(txn, "004010")
         
         assert report.error_count == 0 or report.is_valid
 
-    def test_validates_po_number_present(self):
+    def test_validates_po_number_present(self, x12_validator):
         """Must validate PO number is present in BEG03."""
-        from x12.core.validator import X12Validator
-        
-        validator = X12Validator()
-        
         # BEG without PO number
-        report = validator.validate_segment(
+        report = x12_validator.validate_segment(
             "BEG*00*SA~",  # Missing PO number
             "BEG",
             "004010"
@@ -144,14 +103,10 @@ class TestValidate850:
         
         assert len(report.errors) > 0
 
-    def test_validates_line_item_required_fields(self):
+    def test_validates_line_item_required_fields(self, x12_validator):
         """Must validate required PO1 fields."""
-        from x12.core.validator import X12Validator
-        
-        validator = X12Validator()
-        
         # PO1 without quantity
-        report = validator.validate_segment(
+        report = x12_validator.validate_segment(
             "PO1*1~",  # Missing quantity, unit, price
             "PO1",
             "004010"
@@ -209,18 +164,16 @@ class TestGenerate850:
 class TestRoundtrip850:
     """Roundtrip tests for 850."""
 
-    def test_parse_to_model_to_edi(self, minimal_850_content):
+    def test_parse_to_model_to_edi(self, minimal_850_content, parser):
         """Parse→Model→EDI must preserve data."""
-        from x12.core.parser import Parser
         from x12.transactions.supply_chain import PurchaseOrder850
         from x12.core.generator import Generator
         
-        parser = Parser()
         generator = Generator()
         
         # Parse to generic transaction
         interchange = parser.parse(minimal_850_content)
-        txn = interchange.functional_groups[0].transactions[0]
+        txn = interchange.first_transaction
         
         # Convert to typed model
         po = PurchaseOrder850.from_transaction(txn)
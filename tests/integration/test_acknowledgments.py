@@ -9,23 +9,34 @@ Run: pytest tests/integration/test_acknowledgments.py -v
 import pytest
 
 
+@pytest.fixture(scope="module")
+def interchange_837p(minimal_837p_content, parser):
+    """The minimal 837P interchange, parsed once for this module."""
+    return parser.parse(minimal_837p_content)
+
+
+@pytest.fixture(scope="module")
+def report_837p(interchange_837p, x12_validator):
+    """Validation report for the minimal 837P transaction.
+
+    Validating identical content always yields the same report, and the
+    acknowledgment generator only reads it, so it is built once here.
+    """
+    return x12_validator.validate_transaction(
+        interchange_837p.functional_groups[0].transactions[0]
+    )
+
+
 @pytest.mark.integration
 class TestGenerate997:
     """Tests for generating 997 functional acknowledgments."""
 
-    def test_generate_997_for_valid_transaction(self, minimal_837p_content):
+    def test_generate_997_for_valid_transaction(self, interchange_837p, report_837p):
         """Must generate 997 acknowledging valid transaction."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
         from x12.acknowledgments import AcknowledgmentGenerator
         
-        parser = Parser()
-        validator = X12Validator()
-        
-        # Parse and validate
-        interchange = parser.parse(minimal_837p_content)
-        txn = interchange.functional_groups[0].transactions[0]
-        report = validator.validate_transaction(txn)
+        interchange = interchange_837p
+        report = report_837p
         
         # Generate 997
         ack_gen = AcknowledgmentGenerator(
@@ -43,19 +54,12 @@ class TestGenerate997:
         assert ack is not None
         assert ack.functional_id_code == "HC"
 
-    def test_997_accepted_status(self, minimal_837p_content):
+    def test_997_accepted_status(self, interchange_837p, report_837p):
         """997 for valid transaction must have accepted status."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
         from x12.acknowledgments import AcknowledgmentGenerator, FunctionalGroupAckCode
         
-        parser = Parser()
-        validator = X12Validator()
-        
-        interchange = parser.parse(minimal_837p_content)
-        report = validator.validate_transaction(
-            interchange.functional_groups[0].transactions[0]
-        )
+        interchange = interchange_837p
+        report = report_837p
         
         ack_gen = AcknowledgmentGenerator(
             sender_id="R", sender_qualifier="ZZ",
@@ -71,18 +75,13 @@ class TestGenerate997:
         if report.error_count == 0:
             assert ack.group_ack_code == FunctionalGroupAckCode.ACCEPTED
 
-    def test_997_rejected_for_invalid(self, edi_mismatched_control_numbers):
+    def test_997_rejected_for_invalid(self, edi_mismatched_control_numbers, parser, x12_validator):
         """997 for invalid transaction must have rejected status."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
         from x12.acknowledgments import AcknowledgmentGenerator, FunctionalGroupAckCode
         
-        parser = Parser()
-        validator = X12Validator()
-        
         try:
             interchange = parser.parse(edi_mismatched_control_numbers)
-            report = validator.validate_transaction(
+            report = x12_validator.validate_transaction(
                 interchange.functional_groups[0].transactions[0]
             )
             
@@ -103,19 +102,12 @@ class TestGenerate997:
             # Parsing may fail for invalid content - that's OK
             pass
 
-    def test_997_contains_ak_segments(self, minimal_837p_content):
+    def test_997_contains_ak_segments(self, interchange_837p, report_837p):
         """Generated 997 must contain AK1, AK2, AK5, AK9 segments."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
         from x12.acknowledgments import AcknowledgmentGenerator, AcknowledgmentSerializer
         
-        parser = Parser()
-        validator = X12Validator()
-        
-        interchange = parser.parse(minimal_837p_content)
-        report = validator.validate_transaction(
-            interchange.functional_groups[0].transactions[0]
-        )
+        interchange = interchange_837p
+        report = report_837p
         
         ack_gen = AcknowledgmentGenerator(
             sender_id="R", sender_qualifier="ZZ",
@@ -140,17 +132,12 @@ class TestGenerate997:
 class TestGenerate999:
     """Tests for generating 999 implementation acknowledgments (HIPAA)."""
 
-    def test_generate_999_for_hipaa_transaction(self, minimal_837p_content):
+    def test_generate_999_for_hipaa_transaction(self, interchange_837p, x12_validator):
         """Must generate 999 for HIPAA transaction."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
         from x12.acknowledgments import AcknowledgmentGenerator
         
-        parser = Parser()
-        validator = X12Validator()
-        
-        interchange = parser.parse(minimal_837p_content)
-        report = validator.validate_transaction(
+        interchange = interchange_837p
+        report = x12_validator.validate_transaction(
             interchange.functional_groups[0].transactions[0],
             version="005010X222A1"
         )
@@ -209,22 +196,16 @@ class TestGenerate999:
 class TestAcknowledgmentRoundtrip:
     """Tests for acknowledgment roundtrip."""
 
-    def test_997_is_parseable(self, minimal_837p_content):
+    def test_997_is_parseable(self, interchange_837p, report_837p, parser):
         """Generated 997 must be parseable."""
-        from x12.core.parser import Parser
-        from x12.core.validator import X12Validator
         from x12.acknowledgments import AcknowledgmentGenerator, AcknowledgmentSerializer
         from x12.core.generator import Generator
         
-        parser = Parser()
-        validator = X12Validator()
         generator = Generator()
         
         # Generate 997
-        interchange = parser.parse(minimal_837p_content)
-        report = validator.validate_transaction(
-            interchange.functional_groups[0].transactions[0]
-        )
+        interchange = interchange_837p
+        report = report_837p
         
         ack_gen = AcknowledgmentGenerator(
             sender_id="RECEIVER", sender_qualifier="ZZ",
@@ -249,10 +230,10 @@ class TestAcknowledgmentRoundtrip:
         )
         
         # Parse the 997
-        ack_interchange = parser.parse(ack_edi)
+        ack_txn = next(parser.iter_transactions(ack_edi), None)
         
-        assert ack_interchange is not None
-        assert ack_interchange.functional_groups[0].transactions[0].transaction_set_id == "997"
+        assert ack_txn is not None
+        assert ack_txn.transaction_set_id == "997"
 
 
 @pytest.mark.integration
@@ -310,3 +291,48 @@ class TestAcknowledgmentFromValidationResults:
         
         assert elem_error.position == 3
         assert elem_error.bad_value == "X" * 100
+
+    def test_maps_results_batch(self):
+        """Batch mapping must split errors into IK3 and IK4 in one pass."""
+        from x12.core.validator import ValidationResult, ValidationSeverity, ValidationCategory
+        from x12.acknowledgments import AcknowledgmentGenerator
+        from x12.acknowledgments.generator import IK3Segment, IK4Segment
+
+        results = [
+            ValidationResult(
+                rule_id="NM1_INVALID_NPI",
+                message="Invalid NPI",
+                severity=ValidationSeverity.ERROR,
+                category=ValidationCategory.ELEMENT,
+                segment_id="NM1",
+                segment_position=4,
+                element_index=9,
+                actual="123",
+            ),
+            ValidationResult(
+                rule_id="837_MISSING_BHT",
+                message="Missing BHT",
+                severity=ValidationSeverity.ERROR,
+                category=ValidationCategory.SYNTAX,
+                segment_id="BHT",
+                segment_position=2,
+            ),
+            ValidationResult(
+                rule_id="ENVELOPE",
+                message="No segment",
+                severity=ValidationSeverity.ERROR,
+                category=ValidationCategory.SYNTAX,
+            ),
+        ]
+
+        ack_gen = AcknowledgmentGenerator(sender_id="R", receiver_id="S")
+        segment_errors, element_errors = ack_gen._map_results_batch(
+            results, implementation=True
+        )
+
+        assert [e.segment_id for e in segment_errors] == ["NM1", "BHT"]
+        assert [e.error_code for e in segment_errors] == ["8", "3"]
+        assert all(isinstance(e, IK3Segment) for e in segment_errors)
+        assert len(element_errors) == 1
+        assert isinstance(element_errors[0], IK4Segment)
+        assert element_errors[0].error_code == "7"
@@ -163,15 +163,15 @@ class TestStreamingPerformance:
         large_content = minimal_837p_content * 1000  # ~2MB
         large_file.write_text(large_content)
         
-        tracemalloc.start()
-        
         reader = StreamingSegmentReader(large_file)
-        segment_count = 0
-        for segment in reader.segments():
-            segment_count += 1
         
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+        # Trace only the streaming loop itself
+        tracemalloc.start()
+        try:
+            segment_count = sum(1 for _ in reader.segments())
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
         
         peak_mb = peak / 1024 / 1024
         
@@ -225,13 +225,29 @@ class TestMemoryUsage:
         # Segment should be reasonably sized
         assert size < 1000, f"Segment size {size} bytes, expected < 1000"
 
-    def test_parser_doesnt_leak_memory(self, minimal_837p_content):
+    def test_per_segment_objects_have_no_instance_dict(self):
+        """Objects created once per segment must use __slots__."""
+        from x12.models import Segment, Element
+        from x12.models.segment import Component, CompositeElement
+        from x12.streaming.reader import StreamingSegment
+
+        component = Component(value="HC", index=0)
+        objects = [
+            Element(value="85", index=1),
+            component,
+            CompositeElement(index=1, components=(component,)),
+            Segment(segment_id="NM1", elements=()),
+            StreamingSegment(segment_id="NM1", raw="NM1*85", position=0),
+        ]
+
+        for obj in objects:
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    def test_parser_doesnt_leak_memory(self, minimal_837p_content, parser):
         """Parser must not leak memory on repeated parses."""
-        from x12.core.parser import Parser
+        import gc
         import tracemalloc
         
-        parser = Parser()
-        
         # Warm up
         parser.parse(minimal_837p_content)
         
@@ -242,6 +258,8 @@ class TestMemoryUsage:
         for _ in range(100):
             parser.parse(minimal_837p_content)
         
+        # Only memory still reachable after a collection counts as a leak
+        gc.collect()
         current = tracemalloc.get_traced_memory()[0]
         tracemalloc.stop()
         
@@ -271,7 +289,7 @@ class TestLargeFilePerformance:
         parser = Parser()
         
         start = time.perf_counter()
-        parser.parse(large_file.read_text())
+        parser.parse_file(large_file)
         elapsed = time.perf_counter() - start
         
         assert elapsed < 2.0, f"Parsing 1MB took {elapsed:.2f}s, expected < 2s"
@@ -65,6 +65,41 @@ class TestDelimiterDetectionFromISA:
         assert delimiters.component == ":"
         assert delimiters.repetition == "^"
 
+    def test_repetition_separator_from_isa11(self, minimal_isa_segment):
+        """Repetition separator must be read from ISA11."""
+        from x12.core.delimiters import Delimiters
+        
+        isa = minimal_isa_segment.replace("*^*", "*!*")
+        
+        assert Delimiters.from_isa(isa).repetition == "!"
+
+    def test_same_isa_delimiters_shared(self, minimal_isa_segment):
+        """Identical ISA delimiters must reuse one cached instance."""
+        from x12.core.delimiters import Delimiters
+        
+        first = Delimiters.from_isa(minimal_isa_segment)
+        
+        assert Delimiters.from_isa(minimal_isa_segment) is first
+
+    def test_standard_isa_returns_shared_instance(self, minimal_isa_segment):
+        """Standard ISA delimiters must resolve to STANDARD_DELIMITERS."""
+        from x12.core.delimiters import STANDARD_DELIMITERS, Delimiters
+        
+        assert Delimiters.from_isa(minimal_isa_segment) is STANDARD_DELIMITERS
+        assert STANDARD_DELIMITERS == Delimiters()
+
+    def test_detect_skips_leading_whitespace(self, isa_with_pipe_delimiters):
+        """detect must read a leading ISA and default anything else."""
+        from x12.core.delimiters import STANDARD_DELIMITERS, Delimiters
+
+        assert Delimiters.detect("\n  " + isa_with_pipe_delimiters).element == "|"
+        assert Delimiters.detect(" " * 5000 + isa_with_pipe_delimiters).element == "|"
+        # Windows that end inside the ISA tag
+        for padding in (4093, 4094, 4095, 4096):
+            assert Delimiters.detect(" " * padding + isa_with_pipe_delimiters).element == "|"
+        assert Delimiters.detect("NM1*85*2*NAME~") is STANDARD_DELIMITERS
+        assert Delimiters.detect("ISA*00*SHORT~") is STANDARD_DELIMITERS
+
     def test_pipe_delimiters_detected(self, isa_with_pipe_delimiters):
         """Pipe-based delimiters must be detected from ISA."""
         from x12.core.delimiters import Delimiters
@@ -205,6 +240,18 @@ class TestDelimiterValidation:
                 repetition="^",
             )
 
+    def test_lengths_checked_per_delimiter(self):
+        """Four characters in total is not enough; each must be one character."""
+        from x12.core.delimiters import Delimiters
+        
+        with pytest.raises(ValueError, match="element"):
+            Delimiters(
+                element="",
+                segment="~",
+                component=":;",  # Makes up the missing character
+                repetition="^",
+            )
+
     def test_delimiter_cannot_be_alphanumeric(self):
         """Delimiters should not be alphanumeric characters."""
         from x12.core.delimiters import Delimiters
@@ -254,6 +301,32 @@ class TestDelimiterEquality:
         cache = {d: "cached_value"}
         assert cache[d] == "cached_value"
 
+    def test_not_equal_to_other_types(self):
+        """Delimiters never compare equal to their concatenated characters."""
+        from x12.core.delimiters import Delimiters
+        
+        d = Delimiters()
+        
+        assert d != "*~:^"
+        assert d != Delimiters(segment="\r\n")
+
+    def test_fields_and_copies(self):
+        """Only the four delimiters are fields; copies stay equal."""
+        import copy
+        import dataclasses
+        import pickle
+
+        from x12.core.delimiters import Delimiters
+
+        d = Delimiters(element="|")
+
+        assert [f.name for f in dataclasses.fields(d)] == [
+            "element", "segment", "component", "repetition",
+        ]
+        assert copy.copy(d) == d
+        assert pickle.loads(pickle.dumps(d)) == d
+        assert dataclasses.replace(d, element="*") == Delimiters()
+
 
 @pytest.mark.unit
 class TestDelimiterSpecialCases:
@@ -13,22 +13,16 @@ import pytest
 class TestClaimAdjustmentReasonCodes:
     """Tests for Claim Adjustment Reason Codes (CARC)."""
 
-    def test_carc_code_set_exists(self):
+    def test_carc_code_set_exists(self, code_registry):
         """CARC code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        carc = registry.get_code_set("claim_adjustment_reason")
+        carc = code_registry.get_code_set("claim_adjustment_reason")
         
         assert carc is not None
         assert carc.name == "claim_adjustment_reason"
 
-    def test_carc_common_codes(self):
+    def test_carc_common_codes(self, code_registry):
         """Must have common CARC codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        carc = registry.get_code_set("claim_adjustment_reason")
+        carc = code_registry.get_code_set("claim_adjustment_reason")
         
         # Contractual Obligation
         assert carc.is_valid("45")
@@ -46,12 +40,9 @@ class TestClaimAdjustmentReasonCodes:
         assert carc.is_valid("3")
         assert "Co-pay" in carc.get_description("3") or "Copay" in carc.get_description("3")
 
-    def test_carc_denial_codes(self):
+    def test_carc_denial_codes(self, code_registry):
         """Must have denial reason codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        carc = registry.get_code_set("claim_adjustment_reason")
+        carc = code_registry.get_code_set("claim_adjustment_reason")
         
         # Not covered
         assert carc.is_valid("96")
@@ -64,22 +55,16 @@ class TestClaimAdjustmentReasonCodes:
 class TestRemittanceAdviceRemarkCodes:
     """Tests for Remittance Advice Remark Codes (RARC)."""
 
-    def test_rarc_code_set_exists(self):
+    def test_rarc_code_set_exists(self, code_registry):
         """RARC code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        rarc = registry.get_code_set("remittance_advice_remark")
+        rarc = code_registry.get_code_set("remittance_advice_remark")
         
         assert rarc is not None
         assert rarc.name == "remittance_advice_remark"
 
-    def test_rarc_common_codes(self):
+    def test_rarc_common_codes(self, code_registry):
         """Must have common RARC codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        rarc = registry.get_code_set("remittance_advice_remark")
+        rarc = code_registry.get_code_set("remittance_advice_remark")
         
         # Common remark codes
         assert rarc.is_valid("M1")  # X-ray not taken
@@ -91,21 +76,15 @@ class TestRemittanceAdviceRemarkCodes:
 class TestServiceTypeCodes:
     """Tests for Service Type Codes (EB01 in 271)."""
 
-    def test_service_type_code_set_exists(self):
+    def test_service_type_code_set_exists(self, code_registry):
         """Service type code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        stc = registry.get_code_set("service_type")
+        stc = code_registry.get_code_set("service_type")
         
         assert stc is not None
 
-    def test_common_service_types(self):
+    def test_common_service_types(self, code_registry):
         """Must have common service type codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        stc = registry.get_code_set("service_type")
+        stc = code_registry.get_code_set("service_type")
         
         # Medical Care
         assert stc.is_valid("1")
@@ -130,21 +109,15 @@ class TestServiceTypeCodes:
 class TestDiagnosisTypeQualifiers:
     """Tests for Diagnosis Type Qualifier codes."""
 
-    def test_diagnosis_qualifier_code_set_exists(self):
+    def test_diagnosis_qualifier_code_set_exists(self, code_registry):
         """Diagnosis qualifier code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        dq = registry.get_code_set("diagnosis_type_qualifier")
+        dq = code_registry.get_code_set("diagnosis_type_qualifier")
         
         assert dq is not None
 
-    def test_diagnosis_qualifiers(self):
+    def test_diagnosis_qualifiers(self, code_registry):
         """Must have HI segment qualifiers."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        dq = registry.get_code_set("diagnosis_type_qualifier")
+        dq = code_registry.get_code_set("diagnosis_type_qualifier")
         
         # Principal Diagnosis
         assert dq.is_valid("ABK")
@@ -164,21 +137,15 @@ class TestDiagnosisTypeQualifiers:
 class TestProcedureCodeQualifiers:
     """Tests for Procedure Code Qualifier codes."""
 
-    def test_procedure_qualifier_code_set_exists(self):
+    def test_procedure_qualifier_code_set_exists(self, code_registry):
         """Procedure qualifier code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        pq = registry.get_code_set("procedure_code_qualifier")
+        pq = code_registry.get_code_set("procedure_code_qualifier")
         
         assert pq is not None
 
-    def test_procedure_qualifiers(self):
+    def test_procedure_qualifiers(self, code_registry):
         """Must have SV1/SV2 procedure qualifiers."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        pq = registry.get_code_set("procedure_code_qualifier")
+        pq = code_registry.get_code_set("procedure_code_qualifier")
         
         # HCPCS
         assert pq.is_valid("HC")
@@ -197,21 +164,15 @@ class TestProcedureCodeQualifiers:
 class TestClaimFrequencyCodes:
     """Tests for Claim Frequency Type codes."""
 
-    def test_claim_frequency_code_set_exists(self):
+    def test_claim_frequency_code_set_exists(self, code_registry):
         """Claim frequency code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        cf = registry.get_code_set("claim_frequency")
+        cf = code_registry.get_code_set("claim_frequency")
         
         assert cf is not None
 
-    def test_claim_frequency_codes(self):
+    def test_claim_frequency_codes(self, code_registry):
         """Must have CLM05-3 frequency codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        cf = registry.get_code_set("claim_frequency")
+        cf = code_registry.get_code_set("claim_frequency")
         
         # Original
         assert cf.is_valid("1")
@@ -230,21 +191,15 @@ class TestClaimFrequencyCodes:
 class TestProviderTaxonomyCodes:
     """Tests for Provider Taxonomy codes."""
 
-    def test_taxonomy_code_set_exists(self):
+    def test_taxonomy_code_set_exists(self, code_registry):
         """Provider taxonomy code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        tax = registry.get_code_set("provider_taxonomy")
+        tax = code_registry.get_code_set("provider_taxonomy")
         
         assert tax is not None
 
-    def test_common_taxonomy_codes(self):
+    def test_common_taxonomy_codes(self, code_registry):
         """Must have common provider taxonomy codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        tax = registry.get_code_set("provider_taxonomy")
+        tax = code_registry.get_code_set("provider_taxonomy")
         
         # Internal Medicine
         assert tax.is_valid("207R00000X")
@@ -263,21 +218,15 @@ class TestProviderTaxonomyCodes:
 class TestRevenueCodeSet:
     """Tests for Revenue Codes (UB-04)."""
 
-    def test_revenue_code_set_exists(self):
+    def test_revenue_code_set_exists(self, code_registry):
         """Revenue code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        rev = registry.get_code_set("revenue_code")
+        rev = code_registry.get_code_set("revenue_code")
         
         assert rev is not None
 
-    def test_common_revenue_codes(self):
+    def test_common_revenue_codes(self, code_registry):
         """Must have common revenue codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        rev = registry.get_code_set("revenue_code")
+        rev = code_registry.get_code_set("revenue_code")
         
         # Room & Board - Private
         assert rev.is_valid("0110")
@@ -291,26 +240,27 @@ class TestRevenueCodeSet:
         # Pharmacy
         assert rev.is_valid("0250")
 
+    def test_revenue_codes_match_exact_string(self, code_registry):
+        """Revenue codes are fixed-width strings; leading zeros matter."""
+        rev = code_registry.get_code_set("revenue_code")
+        
+        assert not rev.is_valid("450")
+        assert not rev.is_valid("00450")
+
 
 @pytest.mark.unit
 class TestModifierCodes:
     """Tests for CPT/HCPCS Modifier codes."""
 
-    def test_modifier_code_set_exists(self):
+    def test_modifier_code_set_exists(self, code_registry):
         """Modifier code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        mod = registry.get_code_set("modifier")
+        mod = code_registry.get_code_set("modifier")
         
         assert mod is not None
 
-    def test_common_modifiers(self):
+    def test_common_modifiers(self, code_registry):
         """Must have common modifier codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        mod = registry.get_code_set("modifier")
+        mod = code_registry.get_code_set("modifier")
         
         # Professional component
         assert mod.is_valid("26")
@@ -332,21 +282,15 @@ class TestModifierCodes:
 class TestUnitsOfMeasure:
     """Tests for Units of Measure codes."""
 
-    def test_uom_code_set_exists(self):
+    def test_uom_code_set_exists(self, code_registry):
         """UOM code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        uom = registry.get_code_set("unit_of_measure")
+        uom = code_registry.get_code_set("unit_of_measure")
         
         assert uom is not None
 
-    def test_common_uom_codes(self):
+    def test_common_uom_codes(self, code_registry):
         """Must have common unit codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        uom = registry.get_code_set("unit_of_measure")
+        uom = code_registry.get_code_set("unit_of_measure")
         
         # Unit
         assert uom.is_valid("UN")
@@ -368,21 +312,15 @@ class TestUnitsOfMeasure:
 class TestAdjustmentGroupCodes:
     """Tests for Claim Adjustment Group codes."""
 
-    def test_adjustment_group_code_set_exists(self):
+    def test_adjustment_group_code_set_exists(self, code_registry):
         """Adjustment group code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        grp = registry.get_code_set("adjustment_group")
+        grp = code_registry.get_code_set("adjustment_group")
         
         assert grp is not None
 
-    def test_adjustment_group_codes(self):
+    def test_adjustment_group_codes(self, code_registry):
         """Must have CAS segment group codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        grp = registry.get_code_set("adjustment_group")
+        grp = code_registry.get_code_set("adjustment_group")
         
         # Contractual Obligation
         assert grp.is_valid("CO")
@@ -406,21 +344,15 @@ class TestAdjustmentGroupCodes:
 class TestEligibilityResponseCodes:
     """Tests for Eligibility/Benefit Response codes."""
 
-    def test_eligibility_info_code_set_exists(self):
+    def test_eligibility_info_code_set_exists(self, code_registry):
         """EB01 code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        eb = registry.get_code_set("eligibility_benefit_info")
+        eb = code_registry.get_code_set("eligibility_benefit_info")
         
         assert eb is not None
 
-    def test_eligibility_info_codes(self):
+    def test_eligibility_info_codes(self, code_registry):
         """Must have EB01 eligibility codes."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        eb = registry.get_code_set("eligibility_benefit_info")
+        eb = code_registry.get_code_set("eligibility_benefit_info")
         
         # Active Coverage
         assert eb.is_valid("1")
@@ -450,21 +382,15 @@ class TestEligibilityResponseCodes:
 class TestTimeQualifierCodes:
     """Tests for Time Period Qualifier codes (EB06)."""
 
-    def test_time_qualifier_code_set_exists(self):
+    def test_time_qualifier_code_set_exists(self, code_registry):
         """Time qualifier code set must exist."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        tq = registry.get_code_set("time_period_qualifier")
+        tq = code_registry.get_code_set("time_period_qualifier")
         
         assert tq is not None
 
-    def test_time_qualifier_codes(self):
+    def test_time_qualifier_codes(self, code_registry):
         """Must have EB06 time qualifiers."""
-        from x12.codes import CodeRegistry
-        
-        registry = CodeRegistry()
-        tq = registry.get_code_set("time_period_qualifier")
+        tq = code_registry.get_code_set("time_period_qualifier")
         
         # Calendar Year
         assert tq.is_valid("23")
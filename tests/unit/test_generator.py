@@ -33,6 +33,15 @@ class TestGeneratorBasics:
         
         assert segment == "NM1*85**NAME~"
 
+    def test_generate_segment_omits_trailing_empty_elements(self):
+        """Must drop trailing empty elements."""
+        from x12.core.generator import Generator
+        
+        generator = Generator()
+        segment = generator.generate_segment("REF", ["EI", "123456789", "", None])
+        
+        assert segment == "REF*EI*123456789~"
+
     def test_generate_uses_configured_delimiters(self):
         """Must use configured delimiters."""
         from x12.core.generator import Generator
@@ -342,6 +351,18 @@ class TestEnvelopeGeneration:
         
         assert isa_pos < gs_pos < st_pos < se_pos < ge_pos < iea_pos
 
+    def test_se_count_from_transaction(self, minimal_837p_content, parser):
+        """SE01 from a parsed transaction must count ST, content and SE."""
+        from x12.core.generator import Generator
+        
+        generator = Generator()
+        txn = parser.parse(minimal_837p_content).functional_groups[0].transactions[0]
+        
+        edi = generator.generate_from_transaction(txn)
+        
+        # ST + 21 content segments + SE
+        assert "SE*23*0001~" in edi
+
 
 @pytest.mark.unit
 class TestModelGeneration:
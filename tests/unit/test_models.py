@@ -240,6 +240,26 @@ class TestLoopModel:
         assert child is not None
         assert child.loop_id == "2010AA"
 
+    def test_loop_find_segments_in_descendants(self):
+        """Loop must find segments in nested loops in document order."""
+        from x12.models import Loop, Segment, Element
+        
+        def ref(value):
+            return Segment(segment_id="REF", elements=[Element(value=value, index=1)])
+        
+        root = Loop(
+            loop_id="ROOT",
+            segments=[ref("1")],
+            loops=[
+                Loop(loop_id="2000A", segments=[ref("2")], loops=[Loop(loop_id="2010AA", segments=[ref("3")])]),
+                Loop(loop_id="2000B", segments=[ref("4")]),
+            ]
+        )
+        
+        assert [s[1].value for s in root.find_segments("REF")] == ["1", "2", "3", "4"]
+        assert root.loops[0].find_segment("REF")[1].value == "2"
+        assert root.find_segment("CLM") is None
+
 
 @pytest.mark.unit
 class TestTransactionSetModel:
@@ -361,6 +381,35 @@ class TestInterchangeModel:
         
         assert len(interchange.functional_groups) == 1
 
+    def test_interchange_first_transaction(self):
+        """first_transaction must return the first transaction in any group."""
+        from x12.models import Interchange, FunctionalGroup, TransactionSet, Loop
+        
+        txn = TransactionSet(
+            transaction_set_id="837",
+            control_number="0001",
+            root_loop=Loop(loop_id="ROOT"),
+        )
+        interchange = Interchange(
+            sender_id="SENDER",
+            sender_qualifier="ZZ",
+            receiver_id="RECEIVER",
+            receiver_qualifier="ZZ",
+            control_number="000000001",
+        )
+        
+        assert interchange.first_transaction is None
+        
+        interchange.functional_groups = [
+            FunctionalGroup(functional_id_code="HC", sender_code="S", receiver_code="R", control_number="1"),
+            FunctionalGroup(
+                functional_id_code="HC", sender_code="S", receiver_code="R", control_number="2",
+                transactions=[txn],
+            ),
+        ]
+        
+        assert interchange.first_transaction is txn
+
 
 @pytest.mark.unit
 class TestHealthcareModels:
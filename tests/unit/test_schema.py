@@ -14,46 +14,52 @@ from decimal import Decimal
 class TestSchemaLoader:
     """Tests for schema loading functionality."""
 
-    def test_load_schema_by_version(self):
+    def test_load_schema_by_version(self, schema_loader):
         """Must load schema by X12 version identifier."""
-        from x12.schema import SchemaLoader
-        
-        loader = SchemaLoader()
-        schema = loader.load("005010X222A1")
+        schema = schema_loader.load("005010X222A1")
         
         assert schema is not None
         assert schema.version == "005010X222A1"
         assert schema.transaction_set_id == "837"
 
-    def test_load_schema_returns_none_for_unknown(self):
+    def test_load_schema_returns_none_for_unknown(self, schema_loader):
         """Must return None for unknown schema version."""
-        from x12.schema import SchemaLoader
-        
-        loader = SchemaLoader()
-        schema = loader.load("UNKNOWN_VERSION")
+        schema = schema_loader.load("UNKNOWN_VERSION")
         
         assert schema is None
 
-    def test_list_available_schemas(self):
+    def test_list_available_schemas(self, schema_loader):
         """Must list all available schema versions."""
-        from x12.schema import SchemaLoader
-        
-        loader = SchemaLoader()
-        versions = loader.list_versions()
+        versions = schema_loader.list_versions()
         
         assert isinstance(versions, list)
         assert "005010X222A1" in versions  # 837P
         assert "005010X221A1" in versions  # 835
 
-    def test_load_schema_by_transaction_type(self):
+    def test_load_schema_by_transaction_type(self, schema_loader):
         """Must load schema by transaction type code."""
+        schema = schema_loader.load_by_transaction("837", "005010")
+        
+        assert schema is not None
+        assert schema.transaction_set_id == "837"
+
+    def test_load_schema_built_once(self):
+        """Repeated loads must return the schema built on first load."""
         from x12.schema import SchemaLoader
         
         loader = SchemaLoader()
-        schema = loader.load_by_transaction("837", "005010")
         
-        assert schema is not None
-        assert schema.transaction_set_id == "837"
+        assert loader.load("005010X221A1") is loader.load("005010X221A1")
+        assert loader.load_by_transaction("835") is loader.load("005010X221A1")
+
+    def test_get_schema_loader_is_cached(self):
+        """get_schema_loader must return one loader whose schemas persist."""
+        from x12.schema import get_schema_loader
+        
+        loader = get_schema_loader()
+        
+        assert get_schema_loader() is loader
+        assert get_schema_loader().load("005010X221A1") is loader.load("005010X221A1")
 
 
 @pytest.mark.unit
@@ -213,37 +219,29 @@ class TestTransactionSchema:
         assert schema.name == "Health Care Claim: Professional"
         assert schema.functional_group_id == "HC"
 
-    def test_schema_has_segment_definitions(self):
+    def test_schema_has_segment_definitions(self, schema_loader):
         """Transaction schema must contain segment definitions."""
-        from x12.schema import SchemaLoader
-        
-        loader = SchemaLoader()
-        schema = loader.load("005010X222A1")
+        schema = schema_loader.load("005010X222A1")
         
         assert schema is not None
         nm1_def = schema.get_segment_definition("NM1")
         assert nm1_def is not None
         assert nm1_def.segment_id == "NM1"
 
-    def test_schema_has_loop_definitions(self):
+    def test_schema_has_loop_definitions(self, schema_loader):
         """Transaction schema must contain loop definitions."""
-        from x12.schema import SchemaLoader
-        
-        loader = SchemaLoader()
-        schema = loader.load("005010X222A1")
+        schema = schema_loader.load("005010X222A1")
         
         assert schema is not None
         loop_def = schema.get_loop_definition("2000A")
         assert loop_def is not None
         assert loop_def.loop_id == "2000A"
 
-    def test_schema_validate_segment(self):
+    def test_schema_validate_segment(self, schema_loader):
         """Schema must validate segment against definition."""
-        from x12.schema import SchemaLoader
         from x12.models import Segment, Element
         
-        loader = SchemaLoader()
-        schema = loader.load("005010X222A1")
+        schema = schema_loader.load("005010X222A1")
         
         # Valid NM1 segment
         segment = Segment(
@@ -258,13 +256,11 @@ class TestTransactionSchema:
         result = schema.validate_segment(segment)
         assert result.is_valid
 
-    def test_schema_validate_segment_missing_required(self):
+    def test_schema_validate_segment_missing_required(self, schema_loader):
         """Schema must reject segment missing required elements."""
-        from x12.schema import SchemaLoader
         from x12.models import Segment, Element
         
-        loader = SchemaLoader()
-        schema = loader.load("005010X222A1")
+        schema = schema_loader.load("005010X222A1")
         
         # NM1 missing required NM101 (Entity Identifier Code)
         segment = Segment(
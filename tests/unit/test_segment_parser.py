@@ -50,6 +50,58 @@ class TestSegmentParserBasics:
         assert hasattr(segment, 'elements')
         assert len(segment.elements) == 3
 
+    def test_parses_bytes_content(self):
+        """Bytes and memoryview content must parse like str content."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        content = b"NM1*85~REF*EI*123~"
+        
+        for source in (content, memoryview(content)):
+            segments = list(parser.parse(source))
+            assert [s.segment_id for s in segments] == ["NM1", "REF"]
+            assert segments[1][2].value == "123"
+
+    def test_qualifier_values_shared(self):
+        """Two-character qualifier values must be shared across segments."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        first, second = parser.parse("NM1*85*2*A~NM1*85*2*B~")
+        
+        assert first[1].value is second[1].value
+
+    def test_segment_ids_interned(self):
+        """Segment IDs must be interned strings."""
+        import sys
+
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        segment = next(parser.parse("".join(["CL", "M*CLAIM1~"])))
+        
+        assert segment.segment_id is sys.intern("CLM")
+
+    def test_long_values_shared_within_parse(self):
+        """Repeated longer values in one parse must share one string."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        first, second = parser.parse("NM1*85*2*ACME CLINIC~NM1*87*2*ACME CLINIC~")
+        
+        assert first[3].value is second[3].value
+
+    def test_empty_elements_shared(self):
+        """Empty elements at the same position must be shared instances."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        first, second = parser.parse("NM1*85*2*A**B~NM1*IL*1*C**D~")
+        
+        assert first[4] is second[4]
+        assert first[4].value == ""
+        assert first[4].index == 4
+
 
 @pytest.mark.unit
 class TestElementAccess:
@@ -100,6 +152,19 @@ class TestElementAccess:
         assert segment[99] is None
         assert segment.element(100) is None
 
+    def test_get_value_with_default(self):
+        """get_value() must return element value or default if absent."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        segment = list(parser.parse("CLM*CLAIM1*150:B~"))[0]
+        
+        assert segment.get_value(1) == "CLAIM1"
+        assert segment.get_value(2) == "150:B"
+        assert segment.get_value(3) == ""
+        assert segment.get_value(3, "UNKNOWN") == "UNKNOWN"
+        assert segment.get_value(0, "X") == "X"
+
     def test_empty_element_has_empty_value(self):
         """Empty elements must have empty string value."""
         from x12.core.parser import SegmentParser
@@ -146,6 +211,39 @@ class TestElementTypeConversion:
         assert segment[2].as_decimal() == Decimal("150.00")
         assert isinstance(segment[2].as_decimal(), Decimal)
 
+    def test_as_decimal_preserves_exponent(self):
+        """Element.as_decimal() must keep the value's written precision."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        segment = list(parser.parse("PO1*1*10*EA*25.00~"))[0]
+        
+        assert segment[2].as_decimal() == Decimal("10")
+        assert str(segment[2].as_decimal()) == "10"
+        assert str(segment[4].as_decimal()) == "25.00"
+
+    def test_as_cents(self):
+        """Element.as_cents() must return integer hundredths."""
+        from x12.core.parser import SegmentParser
+        
+        parser = SegmentParser()
+        segment = list(parser.parse("SV1*HC:99213*150.5*UN*1.255*ABC~"))[0]
+        
+        assert segment[2].as_cents() == 15050
+        assert segment[4].as_cents() == 126
+        assert segment[5].as_cents() == 0
+        assert segment[1].as_cents() == 0
+
+        # Negative amounts round half away from zero
+        segment = list(parser.parse("CAS*CO*45*-12.345*-0.004~"))[0]
+        
+        assert segment[3].as_cents() == -1235
+        assert segment[4].as_cents() == 0
+        
+        segment = next(parser.parse("AMT*AU*+150.5~"))
+        
+        assert segment[2].as_cents() == 15050
+
     def test_as_date_ccyymmdd(self):
         """Element.as_date() must parse CCYYMMDD format."""
         from x12.core.parser import SegmentParser
@@ -272,6 +272,46 @@ class TestTokenizerDelimiterHandling:
         assert segment_ids[0].value == "NM1"
         assert segment_ids[1].value == "REF"
 
+    def test_crlf_segment_terminator(self):
+        """CRLF segment terminators must split segments like LF."""
+        from x12.core.tokenizer import iter_segments
+        from x12.core.delimiters import Delimiters
+
+        delimiters = Delimiters(element="*", segment="\r\n", component=":", repetition="^")
+
+        segments = list(iter_segments("NM1*85*2\r\nREF*EI*123\r\n", delimiters))
+
+        assert segments == ["NM1*85*2", "REF*EI*123", ""]
+
+    def test_segments_split_lazily(self):
+        """Segment splitting must yield segments on demand."""
+        from x12.core.tokenizer import iter_segments
+        from x12.core.delimiters import Delimiters
+
+        segments = iter_segments("NM1*85~REF*EI~", Delimiters())
+
+        assert next(segments) == "NM1*85"
+        assert next(segments) == "REF*EI"
+
+    def test_line_break_after_terminator_skipped(self):
+        """A line break after the terminator must not lead the next segment."""
+        from x12.core.tokenizer import iter_segments
+        from x12.core.delimiters import Delimiters
+
+        segments = list(iter_segments("NM1*85~\nREF*EI~\r\n", Delimiters()))
+
+        assert segments == ["NM1*85", "REF*EI", ""]
+
+    def test_split_segments_matches_iter_segments(self):
+        """Eager splitting must yield the same segments once stripped."""
+        from x12.core.tokenizer import iter_segments, split_segments
+        from x12.core.delimiters import Delimiters
+
+        content = "NM1*85~\nREF*EI~\r\nN3*1 MAIN ST~"
+        eager = [s.strip() for s in split_segments(content, Delimiters())]
+
+        assert eager == [s.strip() for s in iter_segments(content, Delimiters())]
+
     def test_custom_component_separator(self):
         """Tokenizer must work with custom component separator."""
         from x12.core.tokenizer import Tokenizer, TokenType
@@ -341,6 +381,45 @@ class TestTokenizerStreaming:
         first = next(gen)
         assert first.value == "SEG"
 
+    def test_streaming_reader_chunk_boundaries(self, minimal_837p_content):
+        """Streaming reader must yield the same segments for any chunk size."""
+        import io
+
+        from x12.streaming.reader import StreamingSegmentReader
+
+        expected = [s.raw for s in StreamingSegmentReader(minimal_837p_content)]
+
+        for buffer_size in (1, 7, 4096):
+            source = io.StringIO(minimal_837p_content)
+            reader = StreamingSegmentReader(source, buffer_size=buffer_size)
+            assert [s.raw for s in reader] == expected
+
+    def test_streaming_reader_cr_terminator(self):
+        """A bare CR segment terminator must split string and file sources."""
+        import io
+
+        from x12.core.delimiters import Delimiters
+        from x12.streaming.reader import StreamingSegmentReader
+
+        content = "NM1*85*2*NAME\rREF*EI*123\rDTP*472*D8*20231115\r"
+        delimiters = Delimiters(segment="\r")
+
+        for source in (content, io.StringIO(content)):
+            reader = StreamingSegmentReader(source, delimiters=delimiters)
+            assert [s.segment_id for s in reader] == ["NM1", "REF", "DTP"]
+
+    def test_streaming_segment_ids_shared(self, minimal_837p_content):
+        """Streamed segments with the same ID must share one ID string."""
+        from x12.streaming.reader import StreamingSegmentReader
+
+        nm1_ids = [
+            s.segment_id for s in StreamingSegmentReader(minimal_837p_content)
+            if s.segment_id == "NM1"
+        ]
+
+        assert len(nm1_ids) > 1
+        assert all(segment_id is nm1_ids[0] for segment_id in nm1_ids)
+
 
 @pytest.mark.unit
 class TestTokenizerEdgeCases:
@@ -184,25 +184,7 @@ class AcknowledgmentGenerator:
                 all_accepted = False
 
             # Build AK3/AK4 segments from errors
-            ak3_segments = []
-            ak4_segments = []
-
-            for error in report.errors:
-                if error.segment_id:
-                    ak3 = AK3Segment(
-                        segment_id=error.segment_id,
-                        segment_position=error.segment_position or 0,
-                        error_code=self._map_error_to_ak3_code(error),
-                    )
-                    ak3_segments.append(ak3)
-
-                    if error.element_index:
-                        ak4 = AK4Segment(
-                            element_position=error.element_index,
-                            error_code=self._map_error_to_ak4_code(error),
-                            bad_value=error.actual or "",
-                        )
-                        ak4_segments.append(ak4)
+            ak3_segments, ak4_segments = self._map_results_batch(report.errors)
 
             total_errors += report.error_count
 
@@ -274,25 +256,9 @@ class AcknowledgmentGenerator:
                 all_accepted = False
 
             # Build IK3/IK4 segments from errors
-            ik3_segments = []
-            ik4_segments = []
-
-            for error in report.errors:
-                if error.segment_id:
-                    ik3 = IK3Segment(
-                        segment_id=error.segment_id,
-                        segment_position=error.segment_position or 0,
-                        error_code=self._map_error_to_ik3_code(error),
-                    )
-                    ik3_segments.append(ik3)
-
-                    if error.element_index:
-                        ik4 = IK4Segment(
-                            element_position=error.element_index,
-                            error_code=self._map_error_to_ik4_code(error),
-                            bad_value=error.actual or "",
-                        )
-                        ik4_segments.append(ik4)
+            ik3_segments, ik4_segments = self._map_results_batch(
+                report.errors, implementation=True
+            )
 
             total_errors += report.error_count
 
@@ -356,6 +322,58 @@ class AcknowledgmentGenerator:
         """Map validation error to IK4 error code."""
         return self._map_error_to_ak4_code(error)
 
+    def _map_results_batch(
+        self,
+        errors: list[ValidationResult],
+        implementation: bool = False,
+    ) -> tuple[list, list]:
+        """Map validation errors to segment and element errors in one pass.
+
+        Errors without a segment ID are skipped; errors that also carry an
+        element index produce an element error as well.
+
+        Args:
+            errors: Validation errors for a single transaction.
+            implementation: Build IK3/IK4 (999) instead of AK3/AK4 (997).
+
+        Returns:
+            Tuple of (segment errors, element errors).
+        """
+        if implementation:
+            segment_type, element_type = IK3Segment, IK4Segment
+            segment_code = self._map_error_to_ik3_code
+            element_code = self._map_error_to_ik4_code
+        else:
+            segment_type, element_type = AK3Segment, AK4Segment
+            segment_code = self._map_error_to_ak3_code
+            element_code = self._map_error_to_ak4_code
+
+        segment_errors = []
+        element_errors = []
+        add_segment_error = segment_errors.append
+        add_element_error = element_errors.append
+
+        for error in errors:
+            if not error.segment_id:
+                continue
+            add_segment_error(
+                segment_type(
+                    segment_id=error.segment_id,
+                    segment_position=error.segment_position or 0,
+                    error_code=segment_code(error),
+                )
+            )
+            if error.element_index:
+                add_element_error(
+                    element_type(
+                        element_position=error.element_index,
+                        error_code=element_code(error),
+                        bad_value=error.actual or "",
+                    )
+                )
+
+        return segment_errors, element_errors
+
     def _map_to_segment_error(self, error: ValidationResult) -> AK3Segment:
         """Map validation error to AK3 segment error."""
         return AK3Segment(
@@ -383,9 +401,9 @@ class AcknowledgmentSerializer:
 
     def __init__(self, delimiters: Delimiters | None = None) -> None:
         """Initialize serializer."""
-        from x12.core.delimiters import Delimiters
+        from x12.core.delimiters import STANDARD_DELIMITERS
 
-        self._delimiters = delimiters or Delimiters()
+        self._delimiters = delimiters or STANDARD_DELIMITERS
 
     def serialize_997(
         self,
@@ -405,10 +423,9 @@ class AcknowledgmentSerializer:
         Returns:
             Complete EDI interchange string.
         """
-        from x12.core.delimiters import Delimiters
         from x12.core.generator import Generator
 
-        d = delimiters or self._delimiters or Delimiters()
+        d = delimiters or self._delimiters
         gen = Generator(delimiters=d)
         parts = []
 
@@ -455,6 +472,7 @@ class AcknowledgmentSerializer:
             receiver_id=receiver_id,
             functional_id="FA",
             version="005010",
+            segment_count=len(parts),
         )
 
     def to_edi(
@@ -542,4 +560,5 @@ class AcknowledgmentSerializer:
             receiver_id=receiver_id,
             functional_id="FA",  # Functional Acknowledgment
             version="005010X231A1" if is_999 else "005010",
+            segment_count=len(parts),
         )
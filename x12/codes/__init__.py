@@ -6,7 +6,7 @@ Provides code set registry and validation functions for X12 identifiers.
 
 from __future__ import annotations
 
-from x12.codes.registry import CodeRegistry, CodeSet
+from x12.codes.registry import CodeRegistry, CodeSet, get_registry
 from x12.codes.validators import (
     validate_diagnosis_code,
     validate_npi,
@@ -17,6 +17,7 @@ from x12.codes.validators import (
 __all__ = [
     "CodeRegistry",
     "CodeSet",
+    "get_registry",
     "validate_npi",
     "validate_tax_id",
     "validate_diagnosis_code",
@@ -7,33 +7,36 @@ Provides validation functions for NPI, Tax ID, and medical codes.
 from __future__ import annotations
 
 
+# Luhn "double and fold" result for each ASCII digit, indexed by byte value:
+# 0-4 double to 0,2,4,6,8 and 5-9 double to 10-18, whose digit sum is 1,3,5,7,9.
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", b"0246813579")
+
+# Luhn contribution of the CMS "80840" prefix (8 + 0*2 + 8 + 4*2 + 0 = 24),
+# less the ASCII bias of the ten NPI digits (10 * ord("0")).
+_NPI_LUHN_ADDEND = 24 - 10 * ord("0")
+
+
 def validate_npi(npi: str) -> bool:
     """Validate NPI (National Provider Identifier).
 
     NPI must be 10 digits and pass Luhn check with 80840 prefix.
 
+    The check works on the ASCII bytes directly: digits in the doubled
+    positions are folded through a translation table and both halves are
+    summed in C, so no per-digit Python loop runs.
+
     Args:
         npi: NPI string to validate.
 
     Returns:
         True if valid, False otherwise.
     """
-    # Must be 10 digits
-    if not npi or len(npi) != 10 or not npi.isdigit():
+    # Must be 10 ASCII digits
+    if not npi or len(npi) != 10 or not npi.isascii() or not npi.isdigit():
         return False
 
-    # Luhn check with 80840 prefix
-    # Prepend 80840 to make 15 digits, then apply Luhn
-    full_number = "80840" + npi
-
-    total = 0
-    for i, digit in enumerate(reversed(full_number)):
-        d = int(digit)
-        if i % 2 == 1:
-            d *= 2
-            if d > 9:
-                d -= 9
-        total += d
+    raw = npi.encode("ascii")
+    total = _NPI_LUHN_ADDEND + sum(raw[0::2].translate(_LUHN_DOUBLED)) + sum(raw[1::2])
 
     return total % 10 == 0
 
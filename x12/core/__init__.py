@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from x12.core.delimiters import Delimiters
+from x12.core.delimiters import STANDARD_DELIMITERS, Delimiters
 from x12.core.generator import Generator
 from x12.core.loop_builder import LoopBuilder
 from x12.core.parser import Parser, SegmentParser
@@ -18,6 +18,7 @@ from x12.core.validator import (
 
 __all__ = [
     "Delimiters",
+    "STANDARD_DELIMITERS",
     "Tokenizer",
     "Token",
     "TokenType",
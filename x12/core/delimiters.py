@@ -11,11 +11,30 @@ from __future__ import annotations
 
 import string
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from typing import ClassVar
 
 
-@dataclass(frozen=True, slots=True)
-class Delimiters:
+_DELIMITER_NAMES = ("element", "segment", "component", "repetition")
+
+# Fixed ISA offsets read by from_isa
+_ISA_LAYOUT = itemgetter(3, 81, 82, 83, 104, 105)
+
+# Leading characters detect() strips before looking for the ISA; whitespace
+# runs that leave less than the ISA tag in the window fall back to stripping
+# the whole content
+_ISA_PROBE_WINDOW = 4096
+
+
+class _KeySlot:
+    """Slot for the cached delimiter key, kept out of Delimiters' fields."""
+
+    __slots__ = ("_key",)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Delimiters(_KeySlot):
     """X12 delimiter configuration.
 
     Immutable container for the four X12 delimiters extracted from
@@ -42,28 +61,54 @@ class Delimiters:
     repetition: str = "^"
 
     # Characters that cannot be delimiters (alphanumeric)
-    _INVALID_CHARS: ClassVar[set[str]] = set(string.ascii_letters + string.digits)
+    _INVALID_CHARS: ClassVar[frozenset[str]] = frozenset(string.ascii_letters + string.digits)
 
     def __post_init__(self) -> None:
         """Validate delimiter configuration."""
-        self._validate_delimiters()
+        key = self.element + self.segment + self.component + self.repetition
+        # Common case: four distinct single characters, none alphanumeric,
+        # checked with C-level set operations over the joined key. Anything
+        # else goes through the field-by-field checks for a precise error.
+        if not (
+            len(key) == 4
+            and len(self.element) == len(self.component) == len(self.repetition) == 1
+            and len(set(key)) == 4
+            and self._INVALID_CHARS.isdisjoint(key)
+        ):
+            self._validate_delimiters()
+        # All four delimiters concatenated; equality and hashing use this one
+        # string instead of comparing or hashing a tuple of the fields
+        object.__setattr__(self, "_key", key)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all four delimiters in one string comparison."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key == other._key  # type: ignore[attr-defined]
+
+    def __hash__(self) -> int:
+        """Hash the concatenated delimiters (str hashes are cached)."""
+        return hash(self._key)
+
+    def __reduce__(self) -> tuple[type[Delimiters], tuple[str, str, str, str]]:
+        """Rebuild through __init__ so copies and unpickled instances get _key."""
+        return (self.__class__, (self.element, self.segment, self.component, self.repetition))
 
     def _validate_delimiters(self) -> None:
         """Ensure all delimiters are valid and distinct."""
-        delims = [self.element, self.segment, self.component, self.repetition]
-        names = ["element", "segment", "component", "repetition"]
-
-        # Check each delimiter is a single character (except segment can be \r\n)
-        for i, d in enumerate(delims):
-            # Segment terminator can be \r\n for legacy systems
-            if names[i] == "segment" and d == "\r\n":
-                continue
+        delims = (self.element, self.segment, self.component, self.repetition)
+
+        for name, d in zip(_DELIMITER_NAMES, delims):
+            # Check each delimiter is a single character, except the segment
+            # terminator, which can be \r\n for legacy systems
             if len(d) != 1:
-                raise ValueError(f"{names[i]} delimiter must be a single character, got {len(d)}")
+                if name == "segment" and d == "\r\n":
+                    continue
+                raise ValueError(f"{name} delimiter must be a single character, got {len(d)}")
 
-            # Check not alphanumeric (only for single-char delimiters)
-            if len(d) == 1 and d in self._INVALID_CHARS:
-                raise ValueError(f"{names[i]} delimiter cannot be alphanumeric: {d!r}")
+            # Check not alphanumeric
+            if d in self._INVALID_CHARS:
+                raise ValueError(f"{name} delimiter cannot be alphanumeric: {d!r}")
 
         # Check all distinct
         if len(set(delims)) != 4:
@@ -79,6 +124,8 @@ class Delimiters:
         - Position 104 (index 104): Component separator
         - Position 105 (index 105): Segment terminator
 
+        Interchanges with the same delimiters share one cached instance.
+
         Args:
             content: EDI content starting with (or containing) ISA segment.
 
@@ -97,42 +144,100 @@ class Delimiters:
         if not content:
             raise ValueError("Content is empty")
 
-        # Find ISA position
-        isa_pos = content.find("ISA")
-        if isa_pos == -1:
-            raise ValueError("ISA segment not found")
-
-        # Extract ISA segment (106 characters from ISA position)
-        isa_content = content[isa_pos:]
-
-        if len(isa_content) < 106:
-            raise ValueError(
-                f"ISA segment too short: expected 106 characters, got {len(isa_content)}"
-            )
-
-        # Extract delimiters from fixed positions
-        element = isa_content[3]  # Position 3 (after "ISA")
-        segment = isa_content[105]  # Position 105
-        component = isa_content[104]  # Position 104
-
-        # Repetition separator is in ISA11 (element 11)
-        # We need to parse ISA to find it, using the element separator we just found
-        isa_elements = isa_content[:106].split(element)
-        if len(isa_elements) >= 12:
-            repetition = isa_elements[11]  # ISA11
+        # Interchanges almost always start with the ISA, so only search when
+        # the prefix check fails. The common case indexes the content itself;
+        # otherwise only the 106 ISA characters are sliced out.
+        if content.startswith("ISA"):
+            isa = content
         else:
-            repetition = "^"  # Default if not found
-
-        return cls(
-            element=element,
-            segment=segment,
-            component=component,
-            repetition=repetition if len(repetition) == 1 else "^",
+            isa_pos = content.find("ISA")
+            if isa_pos == -1:
+                raise ValueError("ISA segment not found")
+            isa = content[isa_pos:isa_pos + 106]
+
+        if len(isa) < 106:
+            raise ValueError(f"ISA segment too short: expected 106 characters, got {len(isa)}")
+
+        # All fixed-position characters in one C call: element separator (3),
+        # ISA11 and the separators around it (81-83), component (104) and
+        # segment terminator (105)
+        element, before_isa11, isa11, after_isa11, component, segment = _ISA_LAYOUT(isa)
+
+        # Repetition separator is ISA11, at index 82 when ISA06/ISA08 are
+        # padded to their fixed width; otherwise locate it by splitting
+        if before_isa11 == element and after_isa11 == element:
+            repetition = isa11
+        else:
+            isa_elements = isa[:106].split(element)
+            if len(isa_elements) >= 12:
+                repetition = isa_elements[11]  # ISA11
+            else:
+                repetition = "^"  # Default if not found
+
+        return _shared_delimiters(
+            cls,
+            element,
+            segment,
+            component,
+            repetition if len(repetition) == 1 else "^",
         )
 
+    @classmethod
+    def detect(cls, content: str) -> Delimiters:
+        """Pick delimiters for content that may open with an ISA segment.
+
+        Leading whitespace is skipped. Content that then starts with a full
+        ISA segment gets its delimiters from the ISA; anything else gets the
+        standard delimiters.
+
+        Args:
+            content: EDI content.
+
+        Returns:
+            Delimiters for the content.
+
+        Raises:
+            ValueError: If the leading ISA segment is invalid.
+        """
+        if content.startswith("ISA"):
+            start = 0
+        else:
+            # Only a bounded head is copied to skip leading whitespace,
+            # not the whole interchange
+            head = content[:_ISA_PROBE_WINDOW].lstrip()
+            if len(head) < 3 and len(content) > _ISA_PROBE_WINDOW:
+                # The window may have cut the ISA tag short
+                head = content.lstrip()
+            if not head.startswith("ISA"):
+                return STANDARD_DELIMITERS
+            start = content.find("ISA")
+
+        if len(content) - start < 106:
+            return STANDARD_DELIMITERS
+        return cls.from_isa(content)
+
     def __repr__(self) -> str:
         """Return detailed string representation."""
         return (
             f"Delimiters(element={self.element!r}, segment={self.segment!r}, "
             f"component={self.component!r}, repetition={self.repetition!r})"
         )
+
+
+# The delimiters nearly every interchange uses (* ~ : ^). Defaults throughout
+# the package share this one instance rather than constructing their own.
+STANDARD_DELIMITERS = Delimiters()
+
+
+@lru_cache(maxsize=64)
+def _shared_delimiters(
+    cls: type[Delimiters], element: str, segment: str, component: str, repetition: str
+) -> Delimiters:
+    """Build (and validate) each distinct delimiter set once.
+
+    Delimiters is immutable, so detected sets can be shared across
+    interchanges; real-world files use only a handful of combinations.
+    """
+    if cls is Delimiters and element + segment + component + repetition == "*~:^":
+        return STANDARD_DELIMITERS
+    return cls(element=element, segment=segment, component=component, repetition=repetition)
@@ -9,7 +9,7 @@ from __future__ import annotations
 from datetime import date, datetime, time
 from typing import TYPE_CHECKING, Any
 
-from x12.core.delimiters import Delimiters
+from x12.core.delimiters import STANDARD_DELIMITERS, Delimiters
 
 if TYPE_CHECKING:
     from x12.models import Segment, TransactionSet
@@ -27,13 +27,25 @@ class Generator:
         NM1*85*2*NAME~
     """
 
+    __slots__ = (
+        "_delimiters",
+        "_isa_control_number",
+        "_gs_control_number",
+        "_st_control_number",
+        "_isa_prefix",
+    )
+
     def __init__(self, delimiters: Delimiters | None = None) -> None:
         """Initialize generator.
 
         Args:
             delimiters: Delimiter configuration. Defaults to standard delimiters.
         """
-        self._delimiters = delimiters or Delimiters()
+        self._delimiters = delimiters or STANDARD_DELIMITERS
+        # ISA01-ISA04 (authorization and security) never vary, so the
+        # fixed-width start of the ISA is built once per delimiter set
+        e = self._delimiters.element
+        self._isa_prefix = f"ISA{e}00{e}{' ' * 10}{e}00{e}{' ' * 10}{e}"
         self._isa_control_number = 0
         self._gs_control_number = 0
         self._st_control_number = 0
@@ -50,6 +62,8 @@ class Generator:
     ) -> str:
         """Generate a single segment.
 
+        Trailing empty elements are omitted, as X12 requires.
+
         Args:
             segment_id: Segment identifier (e.g., "NM1").
             elements: List of element values. Nested lists are composite elements.
@@ -61,15 +75,24 @@ class Generator:
             >>> gen.generate_segment("NM1", ["85", "2", "NAME"])
             'NM1*85*2*NAME~'
         """
+        # Drop trailing empty elements before formatting anything
+        end = len(elements)
+        while end and (elements[end - 1] is None or elements[end - 1] == ""):
+            end -= 1
+        if end < len(elements):
+            elements = elements[:end]
+
         d = self._delimiters
+        component = d.component
         parts = [segment_id]
+        append = parts.append
 
         for elem in elements:
             if isinstance(elem, list):
                 # Composite element
-                parts.append(d.component.join(str(c) for c in elem))
+                append(component.join([str(c) for c in elem]))
             else:
-                parts.append(str(elem) if elem is not None else "")
+                append(str(elem) if elem is not None else "")
 
         return d.element.join(parts) + d.segment
 
@@ -111,19 +134,16 @@ class Generator:
             control_number = self._isa_control_number
 
         # Use current date/time if not provided
-        now = datetime.now()
-        if date_value is None:
-            date_value = now.date()
-        if time_value is None:
-            time_value = now.time()
+        if date_value is None or time_value is None:
+            now = datetime.now()
+            if date_value is None:
+                date_value = now.date()
+            if time_value is None:
+                time_value = now.time()
 
         # Build ISA with fixed-width fields
         isa = (
-            f"ISA{d.element}"
-            f"00{d.element}"  # ISA01 - Auth qualifier (2)
-            f"          {d.element}"  # ISA02 - Auth info (10)
-            f"00{d.element}"  # ISA03 - Security qualifier (2)
-            f"          {d.element}"  # ISA04 - Security info (10)
+            f"{self._isa_prefix}"  # ISA01-ISA04
             f"{sender_qualifier:2}{d.element}"  # ISA05 (2)
             f"{sender_id:15}{d.element}"  # ISA06 (15)
             f"{receiver_qualifier:2}{d.element}"  # ISA07 (2)
@@ -168,11 +188,12 @@ class Generator:
             self._gs_control_number += 1
             control_number = self._gs_control_number
 
-        now = datetime.now()
-        if date_value is None:
-            date_value = now.date()
-        if time_value is None:
-            time_value = now.time()
+        if date_value is None or time_value is None:
+            now = datetime.now()
+            if date_value is None:
+                date_value = now.date()
+            if time_value is None:
+                time_value = now.time()
 
         return self.generate_segment(
             "GS",
@@ -266,6 +287,7 @@ class Generator:
         receiver_id: str = "RECEIVER",
         functional_id: str | None = None,
         version: str | None = None,
+        segment_count: int | None = None,
     ) -> str:
         """Generate complete EDI with ISA/GS/ST/SE/GE/IEA envelope.
 
@@ -276,6 +298,8 @@ class Generator:
             receiver_id: Interchange receiver ID.
             functional_id: Functional group ID (HC, PO, etc.). Auto-detected if None.
             version: Implementation guide version. Auto-detected if None.
+            segment_count: Number of segments in content, if already known.
+                Counted from content when None.
 
         Returns:
             Complete EDI interchange string.
@@ -314,9 +338,10 @@ class Generator:
             else:
                 version = "005010X222A1"
 
-        # Count segments in content
-        content_segments = content.count(self._delimiters.segment)
-        total_segments = content_segments + 2  # +2 for ST and SE
+        # Count segments in content unless the caller already knows
+        if segment_count is None:
+            segment_count = content.count(self._delimiters.segment)
+        total_segments = segment_count + 2  # +2 for ST and SE
 
         # Generate control numbers
         isa_ctrl = self._isa_control_number + 1
@@ -356,17 +381,13 @@ class Generator:
         Returns:
             Complete EDI interchange with envelope.
         """
-        # Collect all segments from the transaction
+        # Collect all segments from the transaction, counting as we emit
         parts = []
-
-        def collect_segments(loop):
-            for seg in loop.segments:
-                parts.append(self.generate_from_segment(seg))
-            for child in loop.loops:
-                collect_segments(child)
-
         if transaction.root_loop:
-            collect_segments(transaction.root_loop)
+            parts = [
+                self.generate_from_segment(seg)
+                for seg in transaction.root_loop.iter_all_segments()
+            ]
 
         content = "".join(parts)
 
@@ -390,6 +411,7 @@ class Generator:
             receiver_id="RECEIVER",
             functional_id=func_id,
             version=version,
+            segment_count=len(parts),
         )
 
     def generate(self, model: Any) -> str:
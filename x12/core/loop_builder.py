@@ -88,9 +88,9 @@ class LoopBuilder:
         for seg in segments:
             if seg.segment_id == "HL":
                 # HL creates new loop level
-                hl_id = seg[1].value if seg[1] else ""
-                parent_id = seg[2].value if seg[2] else ""
-                level_code = seg[3].value if seg[3] else ""
+                hl_id = seg.get_value(1)
+                parent_id = seg.get_value(2)
+                level_code = seg.get_value(3)
 
                 loop_id = self.HL_LOOP_MAPPING.get(level_code, f"HL_{level_code}")
                 new_loop = Loop(loop_id=loop_id)
@@ -109,7 +109,7 @@ class LoopBuilder:
 
             elif seg.segment_id == "NM1" and current_2000_loop:
                 # NM1 may create a 2010 level sub-loop
-                entity_code = seg[1].value if seg[1] else ""
+                entity_code = seg.get_value(1)
                 sub_loop_id = self.NM1_LOOP_MAPPING.get(entity_code)
 
                 if sub_loop_id:
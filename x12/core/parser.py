@@ -6,15 +6,79 @@ Parses tokenized EDI content into Segment objects.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from sys import intern
 from typing import TYPE_CHECKING
 
 from x12.core.delimiters import Delimiters
-from x12.core.tokenizer import Tokenizer
+from x12.core.tokenizer import Tokenizer, iter_segments, split_segments
 from x12.models.segment import Component, CompositeElement, Element, Segment
 
 if TYPE_CHECKING:
-    from x12.models import Interchange, Loop
+    from pathlib import Path
+
+    from x12.models import Interchange, Loop, TransactionSet
+
+
+# Envelope segments handled by the structure builder; everything else is content
+_ENVELOPE_SEGMENT_IDS = frozenset({"ISA", "GS", "ST", "SE", "GE", "IEA"})
+
+# HL03 hierarchical level code to loop ID
+_HL_LOOP_IDS = {
+    "20": "2000A",  # Billing Provider
+    "22": "2000B",  # Subscriber
+    "23": "2000C",  # Patient
+    "S": "SHIPMENT",
+    "O": "ORDER",
+    "I": "ITEM",
+}
+
+# Empty elements are immutable and very common (NM1*85*2*NAME*****XX*...),
+# so one shared instance per element position is reused across parses
+_EMPTY_ELEMENTS = tuple(Element(value="", index=i) for i in range(64))
+
+
+def _as_text(content: str | bytes | bytearray | memoryview) -> str:
+    """Decode byte content once at the parser boundary."""
+    if isinstance(content, str):
+        return content
+    return str(content, "utf-8")
+
+
+def _read_file(path: str | Path) -> str:
+    """Decode a file straight from a memory map, without a bytes copy."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return _as_text(mapped)
+
+
+def _split_interchanges(content: str, delimiters: Delimiters) -> list[str]:
+    """Split content into one string per ISA...IEA interchange.
+
+    An interchange starts wherever an ISA segment opens, i.e. "ISA" plus the
+    element separator directly after a segment terminator (line breaks
+    between the two are allowed).
+    """
+    marker = "ISA" + delimiters.element
+    terminator = delimiters.segment
+    newline_terminated = terminator in ("\n", "\r\n")
+
+    starts = [content.find(marker)]
+    pos = starts[0] + 1
+    while (idx := content.find(marker, pos)) != -1:
+        before = idx
+        while before > 0 and content[before - 1] in "\r\n":
+            before -= 1
+        if content.endswith(terminator, 0, before) or (newline_terminated and before < idx):
+            starts.append(idx)
+        pos = idx + 1
+    starts.append(len(content))
+
+    return [content[start:end] for start, end in zip(starts, starts[1:])]
 
 
 class SegmentParser:
@@ -27,6 +91,8 @@ class SegmentParser:
         NM1
     """
 
+    __slots__ = ("_delimiters", "_tokenizer")
+
     def __init__(self, delimiters: Delimiters | None = None) -> None:
         """Initialize parser.
 
@@ -36,78 +102,107 @@ class SegmentParser:
         self._delimiters = delimiters
         self._tokenizer = Tokenizer(delimiters)
 
-    def parse(self, content: str) -> Iterator[Segment]:
+    def parse(self, content: str | bytes | bytearray | memoryview) -> Iterator[Segment]:
         """Parse EDI content into segments.
 
         Args:
-            content: Raw EDI string.
+            content: Raw EDI string, or UTF-8 encoded bytes.
 
         Yields:
             Segment objects.
         """
-        if not content or not content.strip():
+        content = _as_text(content)
+        if not content or content.isspace():
             return
 
         # Detect delimiters if needed
         delimiters = self._delimiters
         if delimiters is None:
-            if content.strip().startswith("ISA") and len(content.strip()) >= 106:
-                delimiters = Delimiters.from_isa(content)
-            else:
-                delimiters = Delimiters()
+            delimiters = Delimiters.detect(content)
+
+        yield from self._parse_segments(content, delimiters)
+
+    def _parse_segments(
+        self, content: str, delimiters: Delimiters, eager: bool = False
+    ) -> Iterator[Segment]:
+        """Parse EDI content with already-known delimiters.
 
+        Args:
+            content: Raw EDI string.
+            delimiters: Delimiter configuration to split on.
+            eager: Split all segments up front in one pass. Faster when every
+                segment will be consumed; lazy splitting suits early exits.
+
+        Yields:
+            Segment objects.
+        """
         # Parse using delimiters directly (more efficient than tokenizer for this)
-        segments = self._split_segments(content, delimiters)
+        parse_segment = self._parse_segment
+        terminator_len = len(delimiters.segment)
         position = 0
+        seen: dict[str, str] = {}
 
-        for seg_str in segments:
+        split = split_segments if eager else iter_segments
+        for seg_str in split(content, delimiters):
             seg_str = seg_str.strip()
             if not seg_str:
                 continue
 
-            segment = self._parse_segment(seg_str, delimiters, position)
+            segment = parse_segment(seg_str, delimiters, position, seen)
             if segment:
                 yield segment
 
-            position += len(seg_str) + len(delimiters.segment)
-
-    def _split_segments(self, content: str, delimiters: Delimiters) -> list[str]:
-        """Split content by segment terminator."""
-        # Normalize line endings
-        content = content.replace("\r\n", "\n").replace("\r", "\n")
-
-        if delimiters.segment == "\n":
-            return content.split("\n")
-        elif delimiters.segment == "\r\n":
-            return content.split("\n")  # Already normalized
-        else:
-            return content.split(delimiters.segment)
+            position += len(seg_str) + terminator_len
 
     def _parse_segment(
         self,
         seg_str: str,
         delimiters: Delimiters,
         position: int = 0,
+        seen: dict[str, str] | None = None,
     ) -> Segment | None:
-        """Parse a single segment string."""
+        """Parse a single segment string.
+
+        ``seen`` maps free-text values to the first copy parsed; callers
+        share one dict across a parse so repeated values are one object.
+        """
         if not seg_str:
             return None
+        if seen is None:
+            seen = {}
 
         parts = seg_str.split(delimiters.element)
         if not parts:
             return None
 
-        segment_id = parts[0]
+        # Segment IDs come from a small fixed dictionary; interning shares one
+        # string per ID and lets ID comparisons hit the identity fast path
+        segment_id = intern(parts[0])
+        component = delimiters.component
         elements: list[Element | CompositeElement] = []
 
+        # One C-level scan of the whole segment decides whether any element
+        # can be composite; most segments have none
+        has_composites = component in seg_str
+
         for idx, part in enumerate(parts[1:], start=1):
-            if delimiters.component in part:
+            if has_composites and component in part:
                 # Composite element
-                comp_parts = part.split(delimiters.component)
+                comp_parts = part.split(component)
                 components = tuple(Component(value=v, index=i) for i, v in enumerate(comp_parts))
                 elements.append(CompositeElement(index=idx, components=components))
+            elif not part and idx < len(_EMPTY_ELEMENTS):
+                elements.append(_EMPTY_ELEMENTS[idx])
             else:
-                # Simple element
+                # Simple element. Two-character values are nearly always
+                # qualifiers or entity codes, so share one string per code
+                # with the validator's literal code sets. Longer values are
+                # open-ended, so they are only shared within this parse
+                # rather than growing the interpreter-wide interned table
+                if len(part) == 2:
+                    part = intern(part)
+                elif len(part) > 2:
+                    part = seen.setdefault(part, part)
                 elements.append(Element(value=part, index=idx))
 
         return Segment(
@@ -129,54 +224,134 @@ class Parser:
         >>> print(interchange.functional_groups[0].transactions[0])
     """
 
+    __slots__ = ("_segment_parser",)
+
     def __init__(self) -> None:
         """Initialize parser."""
         self._segment_parser = SegmentParser()
 
-    def parse(self, content: str) -> Interchange:
+    def parse(self, content: str | bytes | bytearray | memoryview) -> Interchange:
         """Parse EDI content into full structure.
 
         Args:
-            content: Raw EDI string.
+            content: Raw EDI string, or UTF-8 encoded bytes.
 
         Returns:
             Interchange object with full hierarchy.
         """
-
-        if not content or not content.strip():
+        content = _as_text(content)
+        if not content or content.isspace():
             raise ValueError("Content is empty")
 
         # Detect delimiters
         delimiters = Delimiters.from_isa(content)
 
-        # Parse all segments
-        segments = list(self._segment_parser.parse(content))
+        # Stream segments straight into the structure builder, reusing the
+        # delimiters detected above rather than scanning the ISA again. The
+        # whole interchange is built, so segments are split in one pass.
+        segments = self._segment_parser._parse_segments(content, delimiters, eager=True)
 
         # Build structure
         interchange = self._build_interchange(segments, delimiters)
 
         return interchange
 
+    def parse_file(self, path: str | Path) -> Interchange:
+        """Parse an EDI file into full structure.
+
+        The file is memory-mapped and decoded straight from the mapping, so
+        no intermediate bytes copy of the whole file is made.
+
+        Args:
+            path: Path to a UTF-8 (or ASCII) encoded EDI file.
+
+        Returns:
+            Interchange object with full hierarchy.
+        """
+        return self.parse(_read_file(path))
+
+    def iter_interchanges(
+        self, content: str | bytes | bytearray | memoryview
+    ) -> Iterator[Interchange]:
+        """Parse content holding one or more interchanges, one at a time.
+
+        Content is split at ISA segment boundaries, and each ISA...IEA
+        interchange is parsed only when requested.
+
+        Args:
+            content: Raw EDI string, or UTF-8 encoded bytes.
+
+        Yields:
+            Interchange objects in document order.
+        """
+        content = _as_text(content)
+        if not content or content.isspace():
+            raise ValueError("Content is empty")
+
+        for chunk in _split_interchanges(content, Delimiters.from_isa(content)):
+            yield self.parse(chunk)
+
+    def iter_transactions(
+        self, content: str | bytes | bytearray | memoryview
+    ) -> Iterator[TransactionSet]:
+        """Parse EDI content one transaction set at a time.
+
+        Each transaction is yielded as soon as its SE segment is read, with
+        its loops built. No Interchange is assembled, so only the current
+        transaction's segments are held in memory.
+
+        Args:
+            content: Raw EDI string, or UTF-8 encoded bytes.
+
+        Yields:
+            TransactionSet objects in document order.
+        """
+        content = _as_text(content)
+        if not content or content.isspace():
+            raise ValueError("Content is empty")
+
+        delimiters = Delimiters.from_isa(content)
+        current_txn: TransactionSet | None = None
+        current_segments: list[Segment] = []
+
+        for seg in self._segment_parser._parse_segments(content, delimiters):
+            segment_id = seg.segment_id
+            if segment_id not in _ENVELOPE_SEGMENT_IDS:
+                current_segments.append(seg)
+            elif segment_id == "ST":
+                current_txn = self._new_transaction(seg)
+                current_segments = []
+            elif segment_id == "SE":
+                if current_txn:
+                    self._build_loops(current_txn.root_loop, current_segments)
+                    yield current_txn
+                current_txn = None
+
     def _build_interchange(
         self,
-        segments: list[Segment],
+        segments: Iterable[Segment],
         delimiters: Delimiters,
     ) -> Interchange:
-        """Build Interchange from segments."""
-        from x12.models import FunctionalGroup, Interchange, Loop, TransactionSet
+        """Build Interchange from segments.
 
-        # Find ISA segment
+        Segments are consumed in a single pass, so a lazy iterator is never
+        materialized as a whole.
+        """
+        from x12.models import FunctionalGroup, Interchange
+
+        # Find ISA segment (advances the iterator past it)
+        segments = iter(segments)
         isa_seg = next((s for s in segments if s.segment_id == "ISA"), None)
         if not isa_seg:
             raise ValueError("ISA segment not found")
 
         interchange = Interchange(
-            sender_id=isa_seg[6].value.strip() if isa_seg[6] else "",
-            sender_qualifier=isa_seg[5].value if isa_seg[5] else "ZZ",
-            receiver_id=isa_seg[8].value.strip() if isa_seg[8] else "",
-            receiver_qualifier=isa_seg[7].value if isa_seg[7] else "ZZ",
-            control_number=isa_seg[13].value if isa_seg[13] else "",
-            version=isa_seg[12].value if isa_seg[12] else "00501",
+            sender_id=isa_seg.get_value(6).strip(),
+            sender_qualifier=isa_seg.get_value(5, "ZZ"),
+            receiver_id=isa_seg.get_value(8).strip(),
+            receiver_qualifier=isa_seg.get_value(7, "ZZ"),
+            control_number=isa_seg.get_value(13),
+            version=isa_seg.get_value(12, "00501"),
             delimiters=delimiters,
         )
 
@@ -186,44 +361,50 @@ class Parser:
         current_segments: list[Segment] = []
 
         for seg in segments:
-            if seg.segment_id == "ISA":
+            segment_id = seg.segment_id
+            if segment_id not in _ENVELOPE_SEGMENT_IDS:
+                # Regular segment; one set lookup instead of walking the
+                # envelope comparisons below for every content segment
+                current_segments.append(seg)
+            elif segment_id == "ISA":
                 continue  # Already processed
-            elif seg.segment_id == "GS":
+            elif segment_id == "GS":
                 # Start new functional group
                 current_fg = FunctionalGroup(
-                    functional_id_code=seg[1].value if seg[1] else "",
-                    sender_code=seg[2].value if seg[2] else "",
-                    receiver_code=seg[3].value if seg[3] else "",
-                    control_number=seg[6].value if seg[6] else "",
+                    functional_id_code=seg.get_value(1),
+                    sender_code=seg.get_value(2),
+                    receiver_code=seg.get_value(3),
+                    control_number=seg.get_value(6),
                     version=seg[8].value if seg[8] else None,
                 )
                 interchange.functional_groups.append(current_fg)
-            elif seg.segment_id == "ST":
+            elif segment_id == "ST":
                 # Start new transaction
-                root_loop = Loop(loop_id="ROOT")
-                current_txn = TransactionSet(
-                    transaction_set_id=seg[1].value if seg[1] else "",
-                    control_number=seg[2].value if seg[2] else "",
-                    root_loop=root_loop,
-                    version=seg[3].value if seg[3] else None,
-                )
+                current_txn = self._new_transaction(seg)
                 if current_fg:
                     current_fg.transactions.append(current_txn)
                 current_segments = []
-            elif seg.segment_id == "SE":
+            elif segment_id == "SE":
                 # End transaction - build loops
                 if current_txn:
                     self._build_loops(current_txn.root_loop, current_segments)
-            elif seg.segment_id == "GE":
+            elif segment_id == "GE":
                 current_fg = None
-            elif seg.segment_id == "IEA":
-                pass  # End of interchange
-            else:
-                # Regular segment
-                current_segments.append(seg)
+            # IEA: end of interchange, nothing to do
 
         return interchange
 
+    def _new_transaction(self, st_seg: Segment) -> TransactionSet:
+        """Create an empty TransactionSet from its ST segment."""
+        from x12.models import Loop, TransactionSet
+
+        return TransactionSet(
+            transaction_set_id=st_seg.get_value(1),
+            control_number=st_seg.get_value(2),
+            root_loop=Loop(loop_id="ROOT"),
+            version=st_seg[3].value if st_seg[3] else None,
+        )
+
     def _build_loops(self, root_loop: Loop, segments: list[Segment]) -> None:
         """Build loop hierarchy from segments."""
         from x12.models import Loop
@@ -236,9 +417,9 @@ class Parser:
         for seg in segments:
             if seg.segment_id == "HL":
                 # Hierarchical level segment
-                hl_id = seg[1].value if seg[1] else ""
-                parent_id = seg[2].value if seg[2] else ""
-                level_code = seg[3].value if seg[3] else ""
+                hl_id = seg.get_value(1)
+                parent_id = seg.get_value(2)
+                level_code = seg.get_value(3)
 
                 # Determine loop ID based on level code
                 loop_id = self._get_loop_id_for_hl(level_code)
@@ -258,12 +439,4 @@ class Parser:
 
     def _get_loop_id_for_hl(self, level_code: str) -> str:
         """Map HL level code to loop ID."""
-        mapping = {
-            "20": "2000A",  # Billing Provider
-            "22": "2000B",  # Subscriber
-            "23": "2000C",  # Patient
-            "S": "SHIPMENT",
-            "O": "ORDER",
-            "I": "ITEM",
-        }
-        return mapping.get(level_code, f"HL_{level_code}")
+        return _HL_LOOP_IDS.get(level_code, f"HL_{level_code}")
@@ -12,6 +12,71 @@ from enum import Enum, auto
 
 from x12.core.delimiters import Delimiters
 
+# Line-style terminators; content is normalized to LF, so all match on LF
+_LINE_TERMINATORS = ("\r\n", "\n", "\r")
+
+
+def iter_segments(content: str, delimiters: Delimiters) -> Iterator[str]:
+    """Lazily split content by segment terminator.
+
+    Walks the content with ``str.find`` so each segment is sliced out only
+    when requested, instead of building the full list of segments up front.
+    CR/CRLF line endings are normalized to LF, and CR/CRLF/LF terminators
+    are all matched on LF. A line break directly after the terminator is
+    skipped rather than sliced into the next segment, so callers' strip()
+    usually returns the slice itself instead of copying it again.
+
+    Args:
+        content: Raw EDI content string.
+        delimiters: Delimiter configuration providing the segment terminator.
+
+    Yields:
+        Raw segment strings (without terminator or following line break).
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    terminator = delimiters.segment
+    if terminator in _LINE_TERMINATORS:
+        terminator = "\n"
+
+    find = content.find
+    step = len(terminator)
+    skip_newline = terminator != "\n"
+    start = 0
+    while (end := find(terminator, start)) != -1:
+        yield content[start:end]
+        start = end + step
+        if skip_newline and content.startswith("\n", start):
+            start += 1
+    yield content[start:]
+
+
+def split_segments(content: str, delimiters: Delimiters) -> list[str]:
+    """Split content by segment terminator in a single C-level pass.
+
+    Eager counterpart of ``iter_segments`` for callers that consume every
+    segment anyway: one ``str.split`` finds all terminators at once instead
+    of a Python-level ``find`` loop. Line endings are normalized the same
+    way, but a line break after a terminator is left at the start of the
+    next segment, so callers must strip.
+
+    Args:
+        content: Raw EDI content string.
+        delimiters: Delimiter configuration providing the segment terminator.
+
+    Returns:
+        Raw segment strings (without terminator).
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    terminator = delimiters.segment
+    if terminator in _LINE_TERMINATORS:
+        terminator = "\n"
+
+    return content.split(terminator)
+
 
 class TokenType(Enum):
     """Types of tokens in X12 EDI."""
@@ -91,36 +156,41 @@ class Tokenizer:
             >>> tokens[0].type
             TokenType.SEGMENT_ID
         """
-        if not content or not content.strip():
+        if not content or content.isspace():
             return
 
         # Auto-detect delimiters if not set
         delimiters = self._delimiters
         if delimiters is None:
-            if content.strip().startswith("ISA") and len(content) >= 106:
-                delimiters = Delimiters.from_isa(content)
-            else:
-                delimiters = Delimiters()  # Use defaults
+            delimiters = Delimiters.detect(content)
+
+        # Delimiters are fixed for the whole call; resolve them once
+        element_sep = delimiters.element
+        component_sep = delimiters.component
+        repetition_sep = delimiters.repetition
+        terminator = delimiters.segment
+        element_len = len(element_sep)
+        component_len = len(component_sep)
+        repetition_len = len(repetition_sep)
+        terminator_len = len(terminator)
 
         # State tracking
         position = 0
         line = 1  # Segment number
 
-        # Split into segments
-        segments = self._split_segments(content, delimiters)
-
-        for seg_content in segments:
-            if not seg_content.strip():
-                position += len(seg_content) + len(delimiters.segment)
+        for seg_content in iter_segments(content, delimiters):
+            stripped = seg_content.strip()
+            if not stripped:
+                position += len(seg_content) + terminator_len
                 continue
 
-            seg_content = seg_content.strip()
+            seg_content = stripped
 
             # Split segment into elements
-            elements = seg_content.split(delimiters.element)
+            elements = seg_content.split(element_sep)
 
             if not elements:
-                position += len(seg_content) + len(delimiters.segment)
+                position += len(seg_content) + terminator_len
                 continue
 
             # First element is segment ID
@@ -136,38 +206,37 @@ class Tokenizer:
             # Process remaining elements
             elem_pos = position + len(segment_id)
             for elem_idx, elem_value in enumerate(elements[1:], start=1):
-                elem_pos += len(delimiters.element)
+                elem_pos += element_len
 
                 # Check for composite element
-                if delimiters.component in elem_value:
+                if component_sep in elem_value:
                     # Composite element - yield components
-                    components = elem_value.split(delimiters.component)
-                    for comp_idx, comp_value in enumerate(components):
+                    part_pos = elem_pos
+                    for comp_idx, comp_value in enumerate(elem_value.split(component_sep)):
                         yield Token(
                             type=TokenType.COMPONENT,
                             value=comp_value,
-                            position=elem_pos,
+                            position=part_pos,
                             line=line,
                             element_index=elem_idx,
                             component_index=comp_idx,
                         )
-                        elem_pos += len(comp_value) + (
-                            len(delimiters.component) if comp_idx < len(components) - 1 else 0
-                        )
-                elif delimiters.repetition in elem_value:
+                        part_pos += len(comp_value) + component_len
+                    # Components rejoin to the element, so it ends where it would unsplit
+                    elem_pos += len(elem_value)
+                elif repetition_sep in elem_value:
                     # Repeated element
-                    repetitions = elem_value.split(delimiters.repetition)
-                    for rep_idx, rep_value in enumerate(repetitions):
+                    part_pos = elem_pos
+                    for rep_idx, rep_value in enumerate(elem_value.split(repetition_sep)):
                         yield Token(
                             type=TokenType.REPETITION if rep_idx > 0 else TokenType.ELEMENT,
                             value=rep_value,
-                            position=elem_pos,
+                            position=part_pos,
                             line=line,
                             element_index=elem_idx,
                         )
-                        elem_pos += len(rep_value) + (
-                            len(delimiters.repetition) if rep_idx < len(repetitions) - 1 else 0
-                        )
+                        part_pos += len(rep_value) + repetition_len
+                    elem_pos += len(elem_value)
                 else:
                     # Simple element
                     yield Token(
@@ -182,25 +251,10 @@ class Tokenizer:
             # Segment terminator
             yield Token(
                 type=TokenType.SEGMENT_TERMINATOR,
-                value=delimiters.segment,
+                value=terminator,
                 position=elem_pos,
                 line=line,
             )
 
-            position = elem_pos + len(delimiters.segment)
+            position = elem_pos + terminator_len
             line += 1
-
-    def _split_segments(self, content: str, delimiters: Delimiters) -> list[str]:
-        """Split content into segments using segment terminator."""
-        # Handle Windows line endings in content
-        content = content.replace("\r\n", "\n").replace("\r", "\n")
-
-        # Split by segment terminator
-        if delimiters.segment == "\n":
-            segments = content.split("\n")
-        elif delimiters.segment == "\r\n":
-            segments = content.replace("\n", "\r\n").split("\r\n")
-        else:
-            segments = content.split(delimiters.segment)
-
-        return segments
@@ -6,14 +6,34 @@ Multi-level validation: syntax, structure, element, semantic.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
+from x12.codes.validators import validate_npi
+from x12.models.segment import parse_cents
+
 if TYPE_CHECKING:
-    from x12.models import TransactionSet
+    from x12.models import Segment, TransactionSet
+
+# Packed-integer masks for checking eight ASCII bytes at once (CCYYMMDD dates)
+_ASCII_ZEROS = 0x3030303030303030
+_HIGH_NIBBLES = 0xF0F0F0F0F0F0F0F0
+_SIXES = 0x0606060606060606
+_LOW_BYTES = 0x00FF00FF00FF00FF
+
+# Days per month, indexed 1-12 (February allows 29; leap years checked separately)
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# NM101 entity codes that require NM103 (name)
+_NM1_NAME_REQUIRED_ENTITIES = frozenset({"85", "IL", "QC", "PR"})
+
+# HI01-1 diagnosis type qualifiers
+_HI_QUALIFIERS = frozenset({"ABK", "ABF", "ABJ", "ABN", "APR", "BK", "BF"})
+
+# Transaction set ID (ST01) to the segment every such transaction must contain
+_REQUIRED_TRANSACTION_SEGMENTS = {"837": "BHT", "850": "BEG"}
 
 
 class ValidationSeverity(Enum):
@@ -34,7 +54,7 @@ class ValidationCategory(Enum):
     HIPAA = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """A single validation result.
 
@@ -78,7 +98,7 @@ class ValidationRule:
     category: ValidationCategory = ValidationCategory.SYNTAX
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationReport:
     """Complete validation report.
 
@@ -184,6 +204,32 @@ class X12Validator:
         ...         print(error)
     """
 
+    __slots__ = (
+        "strict",
+        "custom_rules",
+        "_segment_validators",
+        "_transaction_validators",
+        "_segment_parser",
+    )
+
+    # Segment ID to per-segment validation method
+    _SEGMENT_VALIDATORS: dict[str, str] = {
+        "NM1": "_validate_nm1",
+        "DTP": "_validate_dtp",
+        "CLM": "_validate_clm",
+        "HI": "_validate_hi",
+        "SV1": "_validate_sv1",
+        "BEG": "_validate_beg",
+        "PO1": "_validate_po1",
+        "REF": "_validate_ref",
+    }
+
+    # Transaction set ID to structural validation method
+    _TRANSACTION_VALIDATORS: dict[str, str] = {
+        "837": "_validate_837_structure",
+        "850": "_validate_850_structure",
+    }
+
     def __init__(
         self,
         strict: bool = False,
@@ -197,6 +243,22 @@ class X12Validator:
         """
         self.strict = strict
         self.custom_rules = custom_rules or []
+        # Resolve the dispatch table to bound methods once, not per segment
+        self._segment_validators: dict[str, Callable[..., None]] = {
+            segment_id: getattr(self, method_name)
+            for segment_id, method_name in self._SEGMENT_VALIDATORS.items()
+        }
+        self._transaction_validators: dict[str, Callable[..., None]] = {
+            transaction_set_id: getattr(self, method_name)
+            for transaction_set_id, method_name in self._TRANSACTION_VALIDATORS.items()
+        }
+
+        from x12.core.delimiters import STANDARD_DELIMITERS
+        from x12.core.parser import SegmentParser
+
+        # Standalone segments use default delimiters; one stateless parser
+        # serves every validate_segment(s) call
+        self._segment_parser = SegmentParser(delimiters=STANDARD_DELIMITERS)
 
     def validate(
         self,
@@ -242,17 +304,20 @@ class X12Validator:
         parser = SegmentParser(delimiters=delimiters)
         segments = list(parser.parse(content))
 
+        # Index segment positions by ID once; the checks below share it
+        index = self._index_segments(segments)
+
         # Validate envelope structure
-        self._validate_envelope(segments, report)
+        self._validate_envelope(index, report)
 
         # Validate control number matching
-        self._validate_control_numbers(segments, report)
+        self._validate_control_numbers(segments, index, report)
 
         # Validate segment counts
-        self._validate_segment_counts(segments, report)
+        self._validate_segment_counts(segments, index, report)
 
         # Validate transaction-specific requirements
-        self._validate_transaction_requirements(segments, report, version)
+        self._validate_transaction_requirements(segments, index, report, version)
 
         return report
 
@@ -272,38 +337,89 @@ class X12Validator:
         Returns:
             ValidationReport for this segment.
         """
-        report = ValidationReport()
+        return self.validate_segments([segment_str], segment_id, version)[0]
 
-        from x12.core.delimiters import Delimiters
-        from x12.core.parser import SegmentParser
+    def validate_segments(
+        self,
+        segment_strs: Iterable[str],
+        segment_id: str,
+        version: str | None = None,
+    ) -> list[ValidationReport]:
+        """Validate a batch of segments.
 
-        delimiters = Delimiters()
-        parser = SegmentParser(delimiters=delimiters)
+        The validator's segment parser is shared across every batch rather
+        than built per call.
 
-        segments = list(parser.parse(segment_str))
-        if not segments:
-            report.add_error("EMPTY_SEGMENT", "No segment found")
-            return report
+        Args:
+            segment_strs: Raw segment strings.
+            segment_id: Expected segment ID.
+            version: Implementation version.
 
-        segment = segments[0]
-
-        # Validate based on segment type
-        if segment.segment_id == "NM1":
-            self._validate_nm1(segment, report, version)
-        elif segment.segment_id == "DTP":
-            self._validate_dtp(segment, report, version)
-        elif segment.segment_id == "CLM":
-            self._validate_clm(segment, report, version)
-        elif segment.segment_id == "HI":
-            self._validate_hi(segment, report, version)
-        elif segment.segment_id == "SV1":
-            self._validate_sv1(segment, report, version)
-        elif segment.segment_id == "BEG":
-            self._validate_beg(segment, report, version)
-        elif segment.segment_id == "PO1":
-            self._validate_po1(segment, report, version)
-        elif segment.segment_id == "REF":
-            self._validate_ref(segment, report, version)
+        Returns:
+            One ValidationReport per segment string, in input order.
+        """
+        parser = self._segment_parser
+        validators = self._segment_validators
+        reports = []
+
+        for segment_str in segment_strs:
+            report = ValidationReport()
+            reports.append(report)
+
+            segment = next(parser.parse(segment_str), None)
+            if segment is None:
+                report.add_error("EMPTY_SEGMENT", "No segment found")
+                continue
+
+            # Validate based on segment type
+            segment_validator = validators.get(segment.segment_id)
+            if segment_validator is not None:
+                segment_validator(segment, report, version)
+
+        return reports
+
+    def validate_stream(
+        self,
+        segments: Iterable[Segment],
+        version: str | None = None,
+    ) -> ValidationReport:
+        """Validate segments as they are produced.
+
+        Per-segment rules run on each segment as it arrives, and each ST/SE
+        pair is checked for its required segment (BHT in 837, BEG in 850),
+        so no transaction tree or segment list is built.
+
+        Args:
+            segments: Parsed segments, e.g. from ``SegmentParser.parse``.
+            version: Implementation version.
+
+        Returns:
+            ValidationReport for the whole stream.
+
+        Example:
+            >>> report = validator.validate_stream(SegmentParser().parse(content))
+        """
+        report = ValidationReport()
+        validators = self._segment_validators
+        txn_type = ""
+        required: str | None = None
+
+        for segment in segments:
+            segment_id = segment.segment_id
+
+            segment_validator = validators.get(segment_id)
+            if segment_validator is not None:
+                segment_validator(segment, report, version)
+
+            if segment_id == "ST":
+                txn_type = segment.get_value(1)
+                required = _REQUIRED_TRANSACTION_SEGMENTS.get(txn_type)
+            elif segment_id == required:
+                required = None
+            elif segment_id == "SE":
+                if required is not None:
+                    self._add_missing_segment_error(report, txn_type, required)
+                required = None
 
         return report
 
@@ -324,30 +440,38 @@ class X12Validator:
         report = ValidationReport()
 
         # Check for required segments based on transaction type
-        if transaction.transaction_set_id == "837":
-            self._validate_837_structure(transaction, report, version)
-        elif transaction.transaction_set_id == "850":
-            self._validate_850_structure(transaction, report, version)
+        structure_validator = self._transaction_validators.get(transaction.transaction_set_id)
+        if structure_validator is not None:
+            structure_validator(transaction, report, version)
 
         return report
 
+    def _index_segments(self, segments: list) -> dict[str, list[int]]:
+        """Map each segment ID to the positions where it occurs, in one pass."""
+        index: dict[str, list[int]] = {}
+        for position, segment in enumerate(segments):
+            positions = index.get(segment.segment_id)
+            if positions is None:
+                index[segment.segment_id] = [position]
+            else:
+                positions.append(position)
+        return index
+
     def _validate_envelope(
         self,
-        segments: list,
+        index: dict[str, list[int]],
         report: ValidationReport,
     ) -> None:
         """Validate ISA/IEA, GS/GE, ST/SE structure."""
-        seg_ids = [s.segment_id for s in segments]
-
         # Check ISA/IEA
-        if "ISA" not in seg_ids:
+        if "ISA" not in index:
             report.add_error("MISSING_ISA", "ISA segment required")
-        if "IEA" not in seg_ids:
+        if "IEA" not in index:
             report.add_error("MISSING_IEA", "IEA segment required")
 
         # Check GS/GE
-        gs_count = seg_ids.count("GS")
-        ge_count = seg_ids.count("GE")
+        gs_count = len(index.get("GS", ()))
+        ge_count = len(index.get("GE", ()))
         if gs_count != ge_count:
             report.add_error(
                 "GS_GE_MISMATCH",
@@ -356,8 +480,8 @@ class X12Validator:
             )
 
         # Check ST/SE
-        st_count = seg_ids.count("ST")
-        se_count = seg_ids.count("SE")
+        st_count = len(index.get("ST", ()))
+        se_count = len(index.get("SE", ()))
         if st_count != se_count:
             report.add_error(
                 "ST_SE_MISMATCH",
@@ -368,15 +492,16 @@ class X12Validator:
     def _validate_control_numbers(
         self,
         segments: list,
+        index: dict[str, list[int]],
         report: ValidationReport,
     ) -> None:
         """Validate control number matching."""
-        st_segments = [s for s in segments if s.segment_id == "ST"]
-        se_segments = [s for s in segments if s.segment_id == "SE"]
+        st_segments = [segments[i] for i in index.get("ST", ())]
+        se_segments = [segments[i] for i in index.get("SE", ())]
 
         for st, se in zip(st_segments, se_segments, strict=False):
-            st_ctrl = st[2].value if st[2] else ""
-            se_ctrl = se[2].value if se[2] else ""
+            st_ctrl = st.get_value(2)
+            se_ctrl = se.get_value(2)
 
             if st_ctrl != se_ctrl:
                 report.add_error(
@@ -386,12 +511,12 @@ class X12Validator:
                 )
 
         # GS/GE control numbers
-        gs_segments = [s for s in segments if s.segment_id == "GS"]
-        ge_segments = [s for s in segments if s.segment_id == "GE"]
+        gs_segments = [segments[i] for i in index.get("GS", ())]
+        ge_segments = [segments[i] for i in index.get("GE", ())]
 
         for gs, ge in zip(gs_segments, ge_segments, strict=False):
-            gs_ctrl = gs[6].value if gs[6] else ""
-            ge_ctrl = ge[2].value if ge[2] else ""
+            gs_ctrl = gs.get_value(6)
+            ge_ctrl = ge.get_value(2)
 
             if gs_ctrl != ge_ctrl:
                 report.add_error(
@@ -403,12 +528,13 @@ class X12Validator:
     def _validate_segment_counts(
         self,
         segments: list,
+        index: dict[str, list[int]],
         report: ValidationReport,
     ) -> None:
         """Validate SE01 segment counts."""
         # Find ST/SE pairs and count segments between them
-        st_positions = [i for i, s in enumerate(segments) if s.segment_id == "ST"]
-        se_positions = [i for i, s in enumerate(segments) if s.segment_id == "SE"]
+        st_positions = index.get("ST", [])
+        se_positions = index.get("SE", [])
 
         for st_pos, se_pos in zip(st_positions, se_positions, strict=False):
             # Count includes ST and SE
@@ -431,10 +557,10 @@ class X12Validator:
     ) -> None:
         """Validate NM1 segment."""
         # NM103 (name) required for most entity types
-        entity_code = segment[1].value if segment[1] else ""
-        name = segment[3].value if segment[3] else ""
+        entity_code = segment.get_value(1)
+        name = segment.get_value(3)
 
-        if entity_code in ("85", "IL", "QC", "PR") and not name:
+        if entity_code in _NM1_NAME_REQUIRED_ENTITIES and not name:
             report.add_error(
                 "NM1_NAME_REQUIRED",
                 f"NM103 (name) required for entity {entity_code}",
@@ -454,8 +580,8 @@ class X12Validator:
             )
 
         # NM108/09 validation
-        id_qualifier = segment[8].value if segment[8] else ""
-        id_value = segment[9].value if segment[9] else ""
+        id_qualifier = segment.get_value(8)
+        id_value = segment.get_value(9)
 
         if id_value and not id_qualifier:
             report.add_error(
@@ -492,27 +618,7 @@ class X12Validator:
         NPI is a 10-digit number. For validation, prefix with 80840
         and apply Luhn check (ISO/IEC 7812).
         """
-        if not npi or len(npi) != 10:
-            return False
-        if not npi.isdigit():
-            return False
-
-        # NPI Luhn check: prefix with 80840, then standard Luhn
-        # The check digit is already included in the NPI
-        prefixed = "80840" + npi[:9]  # Without check digit
-
-        total = 0
-        for i, digit in enumerate(reversed(prefixed)):
-            d = int(digit)
-            if i % 2 == 0:  # Even positions from right (0-indexed)
-                d *= 2
-                if d > 9:
-                    d -= 9
-            total += d
-
-        # Check digit should make (total + check) % 10 == 0
-        check_digit = int(npi[9])
-        return (total + check_digit) % 10 == 0
+        return validate_npi(npi)
 
     def _validate_dtp(
         self,
@@ -521,9 +627,9 @@ class X12Validator:
         version: str | None,
     ) -> None:
         """Validate DTP segment."""
-        segment[1].value if segment[1] else ""  # DTP01 - Qualifier
-        format_qualifier = segment[2].value if segment[2] else ""  # DTP02 - Format
-        date_value = segment[3].value if segment[3] else ""  # DTP03 - Value
+        segment.get_value(1)  # DTP01 - Qualifier
+        format_qualifier = segment.get_value(2)  # DTP02 - Format
+        date_value = segment.get_value(3)  # DTP03 - Value
 
         # Validate date format qualifier D8 for 8-char dates
         if format_qualifier == "D8":
@@ -554,15 +660,50 @@ class X12Validator:
                     category=ValidationCategory.ELEMENT,
                 )
 
-    def _is_valid_date(self, date_str: str) -> bool:
-        """Check if date string is valid CCYYMMDD."""
-        if len(date_str) != 8:
-            return False
-        try:
-            datetime.strptime(date_str, "%Y%m%d")
+    def _is_numeric(self, value: str) -> bool:
+        """Check if an amount string is numeric.
+
+        Plain decimals take the integer-cents path; anything it rejects
+        (exponents, surrounding spaces, nan/inf) falls back to float() so the
+        accepted forms stay the same.
+        """
+        if parse_cents(value) is not None:
             return True
+        try:
+            float(value)
         except ValueError:
             return False
+        return True
+
+    def _is_valid_date(self, date_str: str) -> bool:
+        """Check if date string is valid CCYYMMDD.
+
+        The eight ASCII bytes are packed into one integer so the digit check
+        and the digit-to-number conversion each run as a few integer ops.
+        """
+        if len(date_str) != 8 or not date_str.isascii():
+            return False
+
+        packed = int.from_bytes(date_str.encode("ascii"), "big")
+
+        # Every byte must be 0x30-0x39: high nibble 3, and low nibble + 6 must not carry
+        if packed & _HIGH_NIBBLES != _ASCII_ZEROS:
+            return False
+        if (packed + _SIXES) & _HIGH_NIBBLES != _ASCII_ZEROS:
+            return False
+
+        # Combine adjacent digits into four two-digit lanes: CC, YY, MM, DD
+        digits = packed - _ASCII_ZEROS
+        pairs = ((digits >> 8) & _LOW_BYTES) * 10 + (digits & _LOW_BYTES)
+        year = (pairs >> 48) * 100 + ((pairs >> 32) & 0xFFFF)
+        month = (pairs >> 16) & 0xFFFF
+        day = pairs & 0xFFFF
+
+        if year == 0 or not 1 <= month <= 12 or not 1 <= day <= _DAYS_IN_MONTH[month]:
+            return False
+        if month == 2 and day == 29:
+            return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        return True
 
     def _validate_clm(
         self,
@@ -572,7 +713,7 @@ class X12Validator:
     ) -> None:
         """Validate CLM segment."""
         # CLM01 - Claim ID required
-        claim_id = segment[1].value if segment[1] else ""
+        claim_id = segment.get_value(1)
         if not claim_id:
             report.add_error(
                 "CLM_ID_REQUIRED",
@@ -583,7 +724,7 @@ class X12Validator:
             )
 
         # CLM02 - Total charge required
-        charge = segment[2].value if segment[2] else ""
+        charge = segment.get_value(2)
         if not charge:
             report.add_error(
                 "CLM_CHARGE_REQUIRED",
@@ -592,20 +733,17 @@ class X12Validator:
                 element_index=2,
                 category=ValidationCategory.ELEMENT,
             )
-        elif charge:
-            try:
-                float(charge)
-            except ValueError:
-                report.add_error(
-                    "CLM_INVALID_CHARGE",
-                    f"CLM02 must be numeric: {charge}",
-                    segment_id="CLM",
-                    element_index=2,
-                    category=ValidationCategory.ELEMENT,
-                )
+        elif not self._is_numeric(charge):
+            report.add_error(
+                "CLM_INVALID_CHARGE",
+                f"CLM02 must be numeric: {charge}",
+                segment_id="CLM",
+                element_index=2,
+                category=ValidationCategory.ELEMENT,
+            )
 
         # CLM05 - Facility code composite required for HIPAA
-        facility = segment[5].value if segment[5] else ""
+        facility = segment.get_value(5)
         if not facility:
             report.add_error(
                 "CLM_FACILITY_REQUIRED",
@@ -626,7 +764,7 @@ class X12Validator:
             elem = segment[1]
             if hasattr(elem, "components") and elem.components:
                 qualifier = elem.components[0].value if elem.components else ""
-                if qualifier not in ("ABK", "ABF", "ABJ", "ABN", "APR", "BK", "BF"):
+                if qualifier not in _HI_QUALIFIERS:
                     report.add_warning(
                         "HI_INVALID_QUALIFIER",
                         f"HI qualifier may be invalid: {qualifier}",
@@ -654,7 +792,7 @@ class X12Validator:
             )
 
         # SV102 - charge required
-        charge = segment[2].value if segment[2] else ""
+        charge = segment.get_value(2)
         if not charge:
             report.add_error(
                 "SV1_CHARGE_REQUIRED",
@@ -665,7 +803,7 @@ class X12Validator:
             )
 
         # SV104 - units required for HIPAA
-        units = segment[4].value if segment[4] else ""
+        units = segment.get_value(4)
         if not units:
             report.add_warning(
                 "SV1_UNITS_RECOMMENDED",
@@ -682,7 +820,7 @@ class X12Validator:
         version: str | None,
     ) -> None:
         """Validate BEG segment."""
-        po_number = segment[3].value if segment[3] else ""
+        po_number = segment.get_value(3)
         if not po_number:
             report.add_error(
                 "BEG_PO_REQUIRED",
@@ -699,7 +837,7 @@ class X12Validator:
         version: str | None,
     ) -> None:
         """Validate PO1 segment."""
-        quantity = segment[2].value if segment[2] else ""
+        quantity = segment.get_value(2)
         if not quantity:
             report.add_warning(
                 "PO1_QTY_RECOMMENDED",
@@ -716,8 +854,8 @@ class X12Validator:
         version: str | None,
     ) -> None:
         """Validate REF segment."""
-        qualifier = segment[1].value if segment[1] else ""
-        value = segment[2].value if segment[2] else ""
+        qualifier = segment.get_value(1)
+        value = segment.get_value(2)
 
         # EIN validation
         if qualifier == "EI" and value and (len(value) != 9 or not value.isdigit()):
@@ -732,34 +870,36 @@ class X12Validator:
     def _validate_transaction_requirements(
         self,
         segments: list,
+        index: dict[str, list[int]],
         report: ValidationReport,
         version: str | None,
     ) -> None:
         """Validate transaction-specific requirements."""
         # Find transaction type from ST segment
-        st_seg = next((s for s in segments if s.segment_id == "ST"), None)
-        if not st_seg:
+        st_positions = index.get("ST")
+        if not st_positions:
             return
 
-        txn_type = st_seg[1].value if st_seg[1] else ""
-        seg_ids = [s.segment_id for s in segments]
+        st_seg = segments[st_positions[0]]
+        txn_type = st_seg.get_value(1)
 
-        if txn_type == "837":
-            # 837 requires BHT
-            if "BHT" not in seg_ids:
-                report.add_error(
-                    "837_MISSING_BHT",
-                    "BHT segment required in 837 transaction",
-                    category=ValidationCategory.STRUCTURE,
-                )
-        elif txn_type == "850":
-            # 850 requires BEG
-            if "BEG" not in seg_ids:
-                report.add_error(
-                    "850_MISSING_BEG",
-                    "BEG segment required in 850 transaction",
-                    category=ValidationCategory.STRUCTURE,
-                )
+        # 837 requires BHT, 850 requires BEG
+        required = _REQUIRED_TRANSACTION_SEGMENTS.get(txn_type)
+        if required is not None and required not in index:
+            self._add_missing_segment_error(report, txn_type, required)
+
+    def _add_missing_segment_error(
+        self,
+        report: ValidationReport,
+        txn_type: str,
+        segment_id: str,
+    ) -> None:
+        """Record a transaction missing its required segment."""
+        report.add_error(
+            f"{txn_type}_MISSING_{segment_id}",
+            f"{segment_id} segment required in {txn_type} transaction",
+            category=ValidationCategory.STRUCTURE,
+        )
 
     def _validate_837_structure(
         self,
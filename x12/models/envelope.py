@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from x12.models.loop import Loop
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionSet:
     """A single X12 transaction set (ST/SE envelope).
 
@@ -32,7 +32,7 @@ class TransactionSet:
         return f"TransactionSet({self.transaction_set_id}, ctrl={self.control_number})"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionalGroup:
     """A functional group (GS/GE envelope).
 
@@ -56,7 +56,7 @@ class FunctionalGroup:
         return f"FunctionalGroup({self.functional_id_code}, {len(self.transactions)} txns)"
 
 
-@dataclass
+@dataclass(slots=True)
 class Interchange:
     """An X12 interchange envelope (ISA/IEA).
 
@@ -80,5 +80,17 @@ class Interchange:
     functional_groups: list[FunctionalGroup] = field(default_factory=list)
     delimiters: Delimiters | None = None
 
+    @property
+    def first_transaction(self) -> TransactionSet | None:
+        """First transaction set in the interchange, across all groups.
+
+        Most interchanges carry a single transaction, so this avoids
+        indexing through functional_groups[0].transactions[0].
+        """
+        for group in self.functional_groups:
+            if group.transactions:
+                return group.transactions[0]
+        return None
+
     def __repr__(self) -> str:
         return f"Interchange({self.sender_id} -> {self.receiver_id}, {len(self.functional_groups)} groups)"
@@ -8,10 +8,12 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from x12.models.segment import Segment
 
 
-@dataclass
+@dataclass(slots=True)
 class Loop:
     """A hierarchical loop containing segments and child loops.
 
@@ -36,6 +38,41 @@ class Loop:
         """Get all segments with given ID."""
         return [seg for seg in self.segments if seg.segment_id == segment_id]
 
+    def iter_all_segments(self) -> Iterator[Segment]:
+        """Iterate over segments in this loop and all descendant loops.
+
+        Segments are yielded in document order. The tree is walked with an
+        explicit stack, so deep hierarchies do not recurse.
+        """
+        stack = [self]
+        while stack:
+            loop = stack.pop()
+            yield from loop.segments
+            stack.extend(reversed(loop.loops))
+
+    def find_segment(self, segment_id: str) -> Segment | None:
+        """Find first segment with given ID in this loop or any descendant."""
+        stack = [self]
+        while stack:
+            loop = stack.pop()
+            for seg in loop.segments:
+                if seg.segment_id == segment_id:
+                    return seg
+            stack.extend(reversed(loop.loops))
+        return None
+
+    def find_segments(self, segment_id: str) -> list[Segment]:
+        """Find all segments with given ID in this loop and its descendants."""
+        # Filter each loop's segment list with one comprehension rather than
+        # resuming a generator per segment
+        found: list[Segment] = []
+        stack = [self]
+        while stack:
+            loop = stack.pop()
+            found += [seg for seg in loop.segments if seg.segment_id == segment_id]
+            stack.extend(reversed(loop.loops))
+        return found
+
     def get_loop(self, loop_id: str) -> Loop | None:
         """Get first child loop with given ID."""
         for loop in self.loops:
@@ -68,7 +105,10 @@ class Loop:
 
     def has_segment(self, segment_id: str) -> bool:
         """Check if loop contains segment with given ID."""
-        return any(seg.segment_id == segment_id for seg in self.segments)
+        for seg in self.segments:
+            if seg.segment_id == segment_id:
+                return True
+        return False
 
     @property
     def children(self) -> list[Loop]:
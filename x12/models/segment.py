@@ -12,6 +12,42 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from x12.core.delimiters import Delimiters
 
+# Decimals are immutable, so small whole-number values (counts, quantities,
+# round charges) are shared instead of re-parsed on every as_decimal() call
+_SMALL_DECIMALS = {str(i): Decimal(i) for i in range(101)}
+_DECIMAL_ZERO = _SMALL_DECIMALS["0"]
+
+
+def parse_cents(value: str) -> int | None:
+    """Parse an X12 decimal (R) value into integer hundredths.
+
+    Works on the digit strings directly so amount checks stay in integer
+    arithmetic; fractions beyond two places are rounded half away from zero,
+    as ``Decimal.quantize`` does with ROUND_HALF_UP.
+
+    Args:
+        value: Decimal string such as "150", "+150.5" or "-12.345".
+
+    Returns:
+        Amount in hundredths, or None if value is not a valid decimal.
+    """
+    sign = 1
+    if value[:1] == "-":
+        sign = -1
+        value = value[1:]
+    elif value[:1] == "+":
+        value = value[1:]
+    whole, _, frac = value.partition(".")
+    if not (whole or frac) or not (whole + frac).isascii():
+        return None
+    if (whole and not whole.isdigit()) or (frac and not frac.isdigit()):
+        return None
+    cents = int(whole or "0") * 100 + int((frac + "00")[:2])
+    # Rounds the magnitude before the sign is applied: -12.345 -> -1235
+    if frac[2:3] >= "5":
+        cents += 1
+    return sign * cents
+
 
 @dataclass(frozen=True, slots=True)
 class Component:
@@ -58,11 +94,20 @@ class Element:
     def as_decimal(self) -> Decimal:
         """Return value as Decimal, 0 if empty or invalid."""
         if not self.value:
-            return Decimal(0)
+            return _DECIMAL_ZERO
+        cached = _SMALL_DECIMALS.get(self.value)
+        if cached is not None:
+            return cached
         try:
             return Decimal(self.value)
         except InvalidOperation:
-            return Decimal(0)
+            return _DECIMAL_ZERO
+
+    def as_cents(self) -> int:
+        """Return value as integer hundredths, 0 if empty or invalid."""
+        if not self.value:
+            return 0
+        return parse_cents(self.value) or 0
 
     def as_date(self) -> date | None:
         """Parse value as date (CCYYMMDD or YYMMDD format)."""
@@ -141,11 +186,14 @@ class CompositeElement:
     def as_decimal(self) -> Decimal:
         """Return first component as Decimal."""
         if self.components:
-            try:
-                return Decimal(self.components[0].value)
-            except InvalidOperation:
-                pass
-        return Decimal(0)
+            return Element(value=self.components[0].value, index=0).as_decimal()
+        return _DECIMAL_ZERO
+
+    def as_cents(self) -> int:
+        """Return first component as integer hundredths."""
+        if self.components:
+            return parse_cents(self.components[0].value) or 0
+        return 0
 
     def as_date(self) -> date | None:
         """Parse first component as date."""
@@ -186,6 +234,16 @@ class Segment:
         """Get element by 1-based index."""
         return self[index]
 
+    def get_value(self, index: int, default: str = "") -> str:
+        """Get element value by 1-based index, or default if absent.
+
+        Equivalent to ``seg[i].value if seg[i] else default`` with a single
+        bounds check instead of two element lookups.
+        """
+        if 0 < index <= len(self.elements):
+            return self.elements[index - 1].value
+        return default
+
     def get_segment(self, segment_id: str) -> Segment | None:
         """For API compatibility - segments don't contain other segments."""
         return None
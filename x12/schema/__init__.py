@@ -12,7 +12,7 @@ from x12.schema.definitions import (
     SegmentDefinition,
     TransactionSchema,
 )
-from x12.schema.loader import SchemaLoader
+from x12.schema.loader import SchemaLoader, get_schema_loader
 
 __all__ = [
     "ElementDefinition",
@@ -20,4 +20,5 @@ __all__ = [
     "LoopDefinition",
     "TransactionSchema",
     "SchemaLoader",
+    "get_schema_loader",
 ]
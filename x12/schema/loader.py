@@ -6,6 +6,8 @@ Loads and provides access to X12 transaction schemas.
 
 from __future__ import annotations
 
+import threading
+
 from x12.schema.definitions import (
     ElementDefinition,
     LoopDefinition,
@@ -18,6 +20,9 @@ class SchemaLoader:
     """Loads X12 transaction schemas.
 
     Provides access to predefined schemas for common X12 transactions.
+    Lookups should go through the shared ``get_schema_loader()`` instance;
+    construct a loader only when schemas will be modified, as each loader
+    builds its own copies.
 
     Example:
         >>> loader = SchemaLoader()
@@ -26,30 +31,36 @@ class SchemaLoader:
         Health Care Claim: Professional
     """
 
-    def __init__(self) -> None:
-        """Initialize schema loader with built-in schemas."""
-        self._schemas: dict[str, TransactionSchema] = {}
-        self._load_builtin_schemas()
-
-    def _load_builtin_schemas(self) -> None:
-        """Load built-in schema definitions."""
+    # Built-in schema versions and the methods that build them
+    _SCHEMA_BUILDERS: dict[str, str] = {
         # Healthcare - HIPAA 5010
-        self._schemas["005010X222A1"] = self._build_837p_schema()  # 837P Professional
-        self._schemas["005010X223A3"] = self._build_837i_schema()  # 837I Institutional
-        self._schemas["005010X224A3"] = self._build_837d_schema()  # 837D Dental
-        self._schemas["005010X221A1"] = self._build_835_schema()  # 835 Remittance
-        self._schemas["005010X279A1"] = self._build_270_schema()  # 270/271 Eligibility
-        self._schemas["005010X212"] = self._build_276_schema()  # 276/277 Claim Status
-        self._schemas["005010X220A1"] = self._build_834_schema()  # 834 Enrollment
-        self._schemas["005010X217"] = self._build_278_schema()  # 278 Authorization
-        self._schemas["005010X218"] = self._build_820_schema()  # 820 Premium Payment
-
+        "005010X222A1": "_build_837p_schema",  # 837P Professional
+        "005010X223A3": "_build_837i_schema",  # 837I Institutional
+        "005010X224A3": "_build_837d_schema",  # 837D Dental
+        "005010X221A1": "_build_835_schema",  # 835 Remittance
+        "005010X279A1": "_build_270_schema",  # 270/271 Eligibility
+        "005010X212": "_build_276_schema",  # 276/277 Claim Status
+        "005010X220A1": "_build_834_schema",  # 834 Enrollment
+        "005010X217": "_build_278_schema",  # 278 Authorization
+        "005010X218": "_build_820_schema",  # 820 Premium Payment
         # Supply Chain - 4010
-        self._schemas["004010"] = self._build_850_schema()  # 850 Purchase Order
-        self._schemas["004010_856"] = self._build_856_schema()  # 856 Ship Notice
-        self._schemas["004010_810"] = self._build_810_schema()  # 810 Invoice
-        self._schemas["004010_855"] = self._build_855_schema()  # 855 PO Acknowledgment
-        self._schemas["004010_860"] = self._build_860_schema()  # 860 PO Change
+        "004010": "_build_850_schema",  # 850 Purchase Order
+        "004010_856": "_build_856_schema",  # 856 Ship Notice
+        "004010_810": "_build_810_schema",  # 810 Invoice
+        "004010_855": "_build_855_schema",  # 855 PO Acknowledgment
+        "004010_860": "_build_860_schema",  # 860 PO Change
+    }
+
+    def __init__(self) -> None:
+        """Initialize schema loader with built-in schemas.
+
+        Schemas are built on first load and kept for the loader's lifetime,
+        so constructing a loader does not build every guide up front.
+        """
+        self._schemas: dict[str, TransactionSchema] = {}
+        # Guards only the build of a schema; loads of schemas already built
+        # read the dict without taking it
+        self._build_lock = threading.Lock()
 
     def load(self, version: str) -> TransactionSchema | None:
         """Load schema by version identifier.
@@ -60,7 +71,17 @@ class SchemaLoader:
         Returns:
             TransactionSchema or None if not found.
         """
-        return self._schemas.get(version)
+        schema = self._schemas.get(version)
+        if schema is None:
+            builder = self._SCHEMA_BUILDERS.get(version)
+            if builder is None:
+                return None
+            with self._build_lock:
+                # Another thread may have built it while we waited
+                schema = self._schemas.get(version)
+                if schema is None:
+                    schema = self._schemas[version] = getattr(self, builder)()
+        return schema
 
     def load_by_transaction(
         self,
@@ -76,9 +97,10 @@ class SchemaLoader:
         Returns:
             TransactionSchema or None if not found.
         """
-        for version, schema in self._schemas.items():
-            if schema.transaction_set_id == transaction_set_id:
-                if base_version in version:
+        for version in self._SCHEMA_BUILDERS:
+            if base_version in version:
+                schema = self.load(version)
+                if schema is not None and schema.transaction_set_id == transaction_set_id:
                     return schema
         return None
 
@@ -88,7 +110,7 @@ class SchemaLoader:
         Returns:
             List of version identifiers.
         """
-        return list(self._schemas.keys())
+        return list(self._SCHEMA_BUILDERS)
 
     def _build_837p_schema(self) -> TransactionSchema:
         """Build 837P Professional Claim schema."""
@@ -1762,3 +1784,28 @@ class SchemaLoader:
         schema.segment_definitions["REF"] = self._build_837p_schema().segment_definitions["REF"]
 
         return schema
+
+
+_loader: SchemaLoader | None = None
+_loader_lock = threading.Lock()
+
+
+def get_schema_loader() -> SchemaLoader:
+    """Get the shared loader of built-in schemas.
+
+    The loader is built on first call and the same instance is returned
+    afterwards, from any thread, so each schema is built once per process.
+    Schemas it returns are shared by every caller; construct a
+    ``SchemaLoader`` directly for schemas that will be modified.
+
+    Returns:
+        Shared SchemaLoader instance.
+    """
+    global _loader
+    loader = _loader
+    if loader is None:
+        with _loader_lock:
+            if _loader is None:
+                _loader = SchemaLoader()
+            loader = _loader
+    return loader
@@ -11,11 +11,27 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, TextIO
 
+from x12.core.tokenizer import iter_segments
+
 if TYPE_CHECKING:
     from x12.core.delimiters import Delimiters
 
 
-@dataclass
+def _segment_id(seg_str: str, elem_sep: str, seen_ids: dict[str, str]) -> str:
+    """Slice the segment ID off a raw segment with a single scan.
+
+    IDs are deduplicated through ``seen_ids`` so a large stream holds one
+    string per distinct ID rather than one per segment. Unlike
+    SegmentParser, the reader uses a per-read dict instead of sys.intern:
+    it promises memory bounded by its buffer, and interning a new ID can
+    resize the interpreter-wide interned-string table mid-read.
+    """
+    end = seg_str.find(elem_sep)
+    seg_id = seg_str if end == -1 else seg_str[:end]
+    return seen_ids.setdefault(seg_id, seg_id)
+
+
+@dataclass(slots=True)
 class StreamingSegment:
     """A segment read from a stream."""
 
@@ -72,9 +88,9 @@ class StreamingSegmentReader:
     def delimiters(self) -> Delimiters:
         """Get delimiters (auto-detected from ISA if needed)."""
         if self._delimiters is None:
-            from x12.core.delimiters import Delimiters
+            from x12.core.delimiters import STANDARD_DELIMITERS
 
-            self._delimiters = Delimiters()
+            self._delimiters = STANDARD_DELIMITERS
         return self._delimiters
 
     def __iter__(self) -> Iterator[StreamingSegment]:
@@ -105,7 +121,7 @@ class StreamingSegmentReader:
 
     def _read_from_file(self, f: TextIO) -> Iterator[StreamingSegment]:
         """Stream segments from a file handle with bounded memory."""
-        from x12.core.delimiters import Delimiters
+        from x12.core.delimiters import STANDARD_DELIMITERS, Delimiters
 
         # Read first 106 chars to detect delimiters from ISA
         header = f.read(106)
@@ -115,70 +131,69 @@ class StreamingSegmentReader:
         if self._delimiters is None and header.startswith("ISA"):
             self._delimiters = Delimiters.from_isa(header)
         elif self._delimiters is None:
-            self._delimiters = Delimiters()
+            self._delimiters = STANDARD_DELIMITERS
 
         segment_term = self._delimiters.segment
         elem_sep = self._delimiters.element
 
-        # Process in chunks
+        # Process in chunks, walking a cursor through the buffer so consumed
+        # segments are only dropped when the next chunk is appended
         buffer = header
+        start = 0
         position = 0
+        term_len = len(segment_term)
+        seen_ids: dict[str, str] = {}
 
         while True:
             # Find next segment terminator
-            term_pos = buffer.find(segment_term)
+            term_pos = buffer.find(segment_term, start)
 
             if term_pos == -1:
                 # Read more data
                 chunk = f.read(self._buffer_size)
                 if not chunk:
                     # End of file - process remaining buffer
-                    if buffer.strip():
-                        seg_str = buffer.strip()
-                        seg_id = (
-                            seg_str[: seg_str.index(elem_sep)] if elem_sep in seg_str else seg_str
-                        )
+                    seg_str = buffer[start:].strip()
+                    if seg_str:
+                        seg_id = _segment_id(seg_str, elem_sep, seen_ids)
                         yield StreamingSegment(segment_id=seg_id, raw=seg_str, position=position)
                     break
-                buffer += chunk
+                buffer = buffer[start:] + chunk
+                start = 0
                 continue
 
             # Extract segment
-            seg_str = buffer[:term_pos].strip()
-            buffer = buffer[term_pos + len(segment_term) :]
+            seg_str = buffer[start:term_pos].strip()
+            start = term_pos + term_len
 
             if seg_str:
-                seg_id = seg_str[: seg_str.index(elem_sep)] if elem_sep in seg_str else seg_str
+                seg_id = _segment_id(seg_str, elem_sep, seen_ids)
                 yield StreamingSegment(segment_id=seg_id, raw=seg_str, position=position)
 
-            position += len(seg_str) + len(segment_term)
+            position += len(seg_str) + term_len
 
     def _read_from_string(self, content: str) -> Iterator[StreamingSegment]:
         """Process string content."""
-        from x12.core.delimiters import Delimiters
+        from x12.core.delimiters import STANDARD_DELIMITERS, Delimiters
 
         # Auto-detect delimiters from ISA
         if self._delimiters is None and content.startswith("ISA"):
             self._delimiters = Delimiters.from_isa(content)
         elif self._delimiters is None:
-            self._delimiters = Delimiters()
+            self._delimiters = STANDARD_DELIMITERS
 
-        segment_term = self._delimiters.segment
+        term_len = len(self._delimiters.segment)
         elem_sep = self._delimiters.element
 
-        # Handle multi-char terminators like \r\n
-        if segment_term in ("\r\n", "\n"):
-            segments = content.replace("\r\n", "\n").split("\n")
-        else:
-            segments = content.split(segment_term)
-
+        # Lazily find terminators rather than splitting the whole content
         position = 0
-        for seg_str in segments:
+        seen_ids: dict[str, str] = {}
+        for seg_str in iter_segments(content, self._delimiters):
             seg_str = seg_str.strip()
             if not seg_str:
                 continue
 
-            seg_id = seg_str[: seg_str.index(elem_sep)] if elem_sep in seg_str else seg_str
+            seg_id = _segment_id(seg_str, elem_sep, seen_ids)
 
             yield StreamingSegment(
                 segment_id=seg_id,
@@ -186,7 +201,7 @@ class StreamingSegmentReader:
                 position=position,
             )
 
-            position += len(seg_str) + len(segment_term)
+            position += len(seg_str) + term_len
 
 
 class StreamingTransactionParser:
@@ -167,8 +167,8 @@ class Claim837P(BaseModel):
             if loop_2010aa:
                 nm1 = loop_2010aa.get_segment("NM1")
                 if nm1:
-                    provider_data["name"] = nm1[3].value if nm1[3] else "UNKNOWN"
-                    provider_data["npi"] = nm1[9].value if nm1[9] else "0000000000"
+                    provider_data["name"] = nm1.get_value(3, "UNKNOWN")
+                    provider_data["npi"] = nm1.get_value(9, "0000000000")
 
         # Extract subscriber from 2000B/2010BA
         subscriber_data = {
@@ -184,9 +184,9 @@ class Claim837P(BaseModel):
             if loop_2010ba:
                 nm1 = loop_2010ba.get_segment("NM1")
                 if nm1:
-                    subscriber_data["last_name"] = nm1[3].value if nm1[3] else "UNKNOWN"
-                    subscriber_data["first_name"] = nm1[4].value if nm1[4] else "UNKNOWN"
-                    subscriber_data["member_id"] = nm1[9].value if nm1[9] else "UNKNOWN"
+                    subscriber_data["last_name"] = nm1.get_value(3, "UNKNOWN")
+                    subscriber_data["first_name"] = nm1.get_value(4, "UNKNOWN")
+                    subscriber_data["member_id"] = nm1.get_value(9, "UNKNOWN")
 
         # Extract claims from 2300 loops or directly from CLM segments
         claims = []
@@ -197,7 +197,7 @@ class Claim837P(BaseModel):
             if clm:
                 claims.append(
                     Claim(
-                        claim_id=clm[1].value if clm[1] else "UNKNOWN",
+                        claim_id=clm.get_value(1, "UNKNOWN"),
                         total_charge=clm[2].as_decimal() if clm[2] else Decimal(0),
                     )
                 )
@@ -208,7 +208,7 @@ class Claim837P(BaseModel):
                     if clm:
                         claims.append(
                             Claim(
-                                claim_id=clm[1].value if clm[1] else "UNKNOWN",
+                                claim_id=clm.get_value(1, "UNKNOWN"),
                                 total_charge=clm[2].as_decimal() if clm[2] else Decimal(0),
                             )
                         )
@@ -222,7 +222,7 @@ class Claim837P(BaseModel):
             if seg.segment_id == "CLM":
                 claims.append(
                     Claim(
-                        claim_id=seg[1].value if seg[1] else "UNKNOWN",
+                        claim_id=seg.get_value(1, "UNKNOWN"),
                         total_charge=seg[2].as_decimal() if seg[2] else Decimal(0),
                     )
                 )
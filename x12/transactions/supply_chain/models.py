@@ -107,23 +107,17 @@ class PurchaseOrder850(PurchaseOrder):
         # Extract line items from PO1 segments
         line_items = []
 
-        def find_po1(loop):
-            for seg in loop.segments:
-                if seg.segment_id == "PO1":
-                    line_items.append(
-                        LineItem(
-                            line_number=seg[1].value if seg[1] else str(len(line_items) + 1),
-                            quantity=seg[2].as_decimal() if seg[2] else Decimal(0),
-                            unit=seg[3].value if seg[3] else "EA",
-                            price=seg[4].as_decimal() if seg[4] else Decimal(0),
-                            upc=seg[7].value if seg[7] else None,
-                            description=seg[8].value if len(seg.elements) > 7 and seg[8] else None,
-                        )
-                    )
-            for child in loop.loops:
-                find_po1(child)
-
-        find_po1(root)
+        for seg in root.find_segments("PO1"):
+            line_items.append(
+                LineItem(
+                    line_number=seg[1].value if seg[1] else str(len(line_items) + 1),
+                    quantity=seg[2].as_decimal() if seg[2] else Decimal(0),
+                    unit=seg.get_value(3, "EA"),
+                    price=seg[4].as_decimal() if seg[4] else Decimal(0),
+                    upc=seg[7].value if seg[7] else None,
+                    description=seg[8].value if len(seg.elements) > 7 and seg[8] else None,
+                )
+            )
 
         return cls(
             po_number=po_number,